@@ -1,8 +1,11 @@
 import streamlit as st
 
+from utils.data import available_leagues, available_seasons
+from utils.leagues import league_info
+
 # Set page configuration
 st.set_page_config(
-    page_title="La Liga Dashboard",
+    page_title="Football League Dashboard",
     page_icon="⚽",
     layout="wide",
     initial_sidebar_state="expanded"
@@ -21,7 +24,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Header
-st.title("La Liga Dashboard")
+st.title("Football League Dashboard")
 
 st.markdown("""
     This project was created out of pure passion for football and data analysis. 
@@ -43,26 +46,30 @@ st.markdown("""
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    st.markdown("### 📊 2023 Season")
-    st.markdown("Analyze complete statistics from the 2023 season, including team performance, player stats, and match results.")
+    st.markdown("### 📊 League Dashboards")
+    st.markdown("Analyze any league and season, including team performance, passing and goalkeeping stats, and match results.")
 
 with col2:
-    st.markdown("### ⚡ 2024 Season")
-    st.markdown("Stay updated with real-time data from the current season, including live standings and recent match results.")
+    st.markdown("### 🔁 Season Comparison")
+    st.markdown("Follow how teams rise and fall between seasons of the same league.")
 
 with col3:
     st.markdown("### 👨‍💻 About")
     st.markdown("Learn more about the creator of this dashboard and the technologies used to build it.")
 
-# Navigation guide
-st.markdown("""
-    ### Navigation Guide
-    
-    Use the sidebar to explore:
-    - **LaLiga 2023**: Complete 2023 season statistics
-    - **LaLiga 2024**: Current season data
-    - **About**: More about the author
-""")
+# Navigation guide: every league-season on disk, nothing is loaded here
+st.markdown("### Navigation Guide")
+st.markdown("Pick a league and season below, or in the sidebar of the **Dashboard** page.")
+for slug in available_leagues():
+    league = league_info(slug)
+    st.markdown(f"**{league.name}**")
+    seasons = available_seasons(slug)[::-1]
+    for i in range(0, len(seasons), 8):
+        for col, season in zip(st.columns(8), seasons[i:i + 8]):
+            with col:
+                st.page_link("pages/1_Dashboard.py", label=str(season), icon="📊", query_params={'league': slug, 'season': season})
+    if len(seasons) > 1:
+        st.page_link("pages/2_Season_Comparison.py", label=f"Compare {league.name} seasons", icon="🔁", query_params={'league': slug})
 
 # Footer
 st.markdown("---")
@@ -0,0 +1,302 @@
+"""Headless benchmarks for the dashboard's data and chart pipeline.
+
+Runs each page's work without a Streamlit server: parsing the season CSVs,
+reading the columnar store, the team frame, key records, goals per
+matchday, the correlation matrix, standings, form, head-to-head, splits,
+rankings and every chart spec. Each step reports min/median/mean wall
+time over ``--repeat`` runs and its peak traced memory.
+
+``--scale-seasons``/``--scale-leagues`` generate a data set with
+``benchmarks.synthetic`` (consistent tables, stats and results, unique team
+ids per league) and time the per-season pipeline over all of it plus each
+league's cross-season views.
+
+Results are printed as one JSON line per step; ``--output`` writes the full
+report, and ``--baseline`` compares against an earlier report and exits
+non-zero when a step got slower than ``--max-regression`` allows.
+
+    python -m benchmarks.pipeline
+    python -m benchmarks.pipeline --league laliga --seasons 2024
+    python -m benchmarks.pipeline --scale-seasons 50 --scale-leagues 5 --output bench.json
+    python -m benchmarks.pipeline --baseline bench.json --max-regression 0.25
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from benchmarks import synthetic
+from utils import charts, store
+from utils.dashboard import metric_full_names
+from utils.data import ROOT_DIR, available_leagues, available_seasons, parse_season, season_paths
+from utils.form import FORM_WINDOW, build_form
+from utils.headtohead import build_head_to_head, combine_head_to_head
+from utils.incremental import MatchAggregates
+from utils.leagues import league_info
+from utils.metrics import DERIVED_METRICS, add_derived_metrics
+from utils.rankings import GK_RANK_METRICS, PASSING_RANK_METRICS, TABLE_RANK_METRICS, rank_frame
+from utils.seasons import season_over_season
+from utils.splits import build_splits
+from utils.standings import build_standings
+from utils.summary import build_summary
+from utils.teams import team_registry
+from utils.transforms import team_match_frame
+
+CORRELATION_COLUMNS = ['PrgP', 'KP', 'xA', 'Ast', 'Cmp%', 'GF', 'Pts', 'xG']
+DEFAULT_LEAGUE = 'laliga'
+DEFAULT_TEAM = 'Barcelona'
+
+
+def measure(name, func, repeat, **labels):
+    """Time ``func`` ``repeat`` times, then once more under tracemalloc for its peak memory."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        'name': name,
+        **labels,
+        'repeat': repeat,
+        'min_ms': round(min(times) * 1000, 3),
+        'median_ms': round(statistics.median(times) * 1000, 3),
+        'mean_ms': round(statistics.fmean(times) * 1000, 3),
+        'peak_mb': round(peak / 1024 ** 2, 3),
+    }
+    print(json.dumps(result, ensure_ascii=False), flush=True)
+    return value, result
+
+
+def season_charts(frames, long, form, head_to_head, splits, team_id, team):
+    """Build every chart a season page can show, keyed by a short name."""
+    table, passing, goalkeeping, matches = (frames[kind] for kind in ['table', 'passing', 'goalkeeping', 'matches'])
+    merged = pd.merge(passing, table.drop(columns='Squad'), on='team_id', suffixes=('_pass', '_table'))
+    goals = MatchAggregates.from_matches(matches).goals_series()
+    advantage = splits.home_advantage().reset_index()
+    opponent_points = head_to_head.team(team_id).reset_index().sort_values('Points', ascending=False)
+    return {
+        'passing ranking': lambda: charts.metric_ranking(passing, ['PrgP', 'KP', 'xA', 'Ast', 'Cmp%'], metric_full_names),
+        'goalkeeping ranking': lambda: charts.metric_ranking(goalkeeping, ['Save%', 'CS', 'GA', 'GA90'], metric_full_names),
+        'derived metrics ranking': lambda: charts.metric_ranking(table, list(DERIVED_METRICS), metric_full_names),
+        'pass completion histogram': lambda: charts.histogram(passing['Cmp%'], 'Cmp%', 'Cmp%', 'Teams', 'dodgerblue'),
+        'passing scatter': lambda: charts.labeled_scatter(merged, 'PrgP', 'GF', 'Pts', 'PrgP vs GF', 'PrgP', 'GF'),
+        'key passes bars': lambda: charts.ranking_bar(passing, 'KP', 'KP', 'KP'),
+        'goals per matchday': lambda: charts.line(goals, 'Goals', 'Matchday', 'Goals'),
+        'goals histogram': lambda: charts.histogram(matches['total_goals'].dropna(), 'Goals', 'Goals', 'Matches', '#ff7f0e', step=1),
+        'home advantage bars': lambda: charts.ranking_bar(advantage, advantage.columns[1], 'Home advantage', 'PPG'),
+        'head-to-head heatmap': lambda: charts.head_to_head_heatmap(head_to_head.long(), 'Head-to-head'),
+        'correlation heatmap': lambda: charts.heatmap(merged[CORRELATION_COLUMNS].corr(), 'Correlation'),
+        'opponent points bars': lambda: charts.ranking_bar(opponent_points, 'Points', 'Points', 'Points', label='Opponent', label_title='Opponent'),
+        'results timeline': lambda: charts.results_timeline(long[long['TeamID'] == team_id], team),
+        'form lines': lambda: charts.form_lines(form.form[form.form['TeamID'] == team_id], FORM_WINDOW, team),
+    }
+
+
+def bench_season(league, season, repeat, team):
+    """Benchmark every step of one real league-season's pages."""
+    results = []
+    labels = {'league': league, 'season': season}
+
+    def step(name, func):
+        value, result = measure(name, func, repeat, **labels)
+        results.append(result)
+        return value
+
+    files = season_paths(league, season)
+    frames = step('parse CSVs', lambda: parse_season(files))
+    sources = store.source_digest(files)
+    if store.read_store(league, season, sources) is not None:
+        step('read store', lambda: store.read_store(league, season, sources))
+    table, passing, goalkeeping, matches = (frames[kind] for kind in ['table', 'passing', 'goalkeeping', 'matches'])
+
+    if team not in set(table['Squad']):
+        # e.g. synthetic data: fall back to the champions
+        team = table.sort_values('Rk')['Squad'].iloc[0]
+    team_id = team_registry().team_id(team)
+    long = step('team match frame', lambda: team_match_frame(matches))
+    step('team filter', lambda: long[long['TeamID'] == team_id])
+    aggregates = step('match aggregates', lambda: MatchAggregates.from_matches(matches))
+    step('goals per matchday', aggregates.goals_series)
+    step('key records', lambda: build_summary(table, goalkeeping, matches, aggregates.result_counts))
+    step('correlation matrix', lambda: pd.merge(passing, table.drop(columns='Squad'), on='team_id', suffixes=('_pass', '_table'))[CORRELATION_COLUMNS].corr())
+    step('derived metrics', lambda: add_derived_metrics(table, passing))
+    step('rankings', lambda: [rank_frame(table, TABLE_RANK_METRICS), rank_frame(passing, PASSING_RANK_METRICS), rank_frame(goalkeeping, GK_RANK_METRICS)])
+    step('standings', lambda: build_standings(long, league_info(league).tiebreaker))
+    form = step('form and streaks', lambda: build_form(long))
+    head_to_head = step('head-to-head', lambda: build_head_to_head(long))
+    splits = step('home/away splits', lambda: build_splits(long))
+
+    # Building the spec and serializing it is all the server does per chart
+    for name, build in season_charts(frames, long, form, head_to_head, splits, team_id, team).items():
+        step(f'chart: {name}', lambda build=build: build().to_dict())
+    return frames, results
+
+
+def season_pipeline(frames, tiebreaker):
+    """Everything the season pages compute for one season, as one call."""
+    table, passing, goalkeeping, matches = (frames[kind] for kind in ['table', 'passing', 'goalkeeping', 'matches'])
+    long = team_match_frame(matches)
+    aggregates = MatchAggregates.from_matches(matches)
+    aggregates.goals_series()
+    build_summary(table, goalkeeping, matches, aggregates.result_counts)
+    pd.merge(passing, table.drop(columns='Squad'), on='team_id', suffixes=('_pass', '_table'))[CORRELATION_COLUMNS].corr()
+    rank_frame(table, TABLE_RANK_METRICS)
+    rank_frame(passing, PASSING_RANK_METRICS)
+    rank_frame(goalkeeping, GK_RANK_METRICS)
+    build_standings(long, tiebreaker)
+    build_form(long)
+    build_splits(long)
+    return build_head_to_head(long)
+
+
+def load_leagues():
+    """Parse every season of every league in the data directory, keyed by league then season."""
+    leagues = {}
+    for league in available_leagues():
+        leagues[league] = {}
+        for season in available_seasons(league):
+            leagues[league][season] = parse_season(season_paths(league, season))
+    return leagues
+
+
+def bench_scaled(repeat):
+    """Benchmark the pipeline and the cross-season views over every league in the data directory.
+
+    Run against a ``benchmarks.synthetic`` data set (see ``run_scaled``):
+    each league is its own history with its own clubs.
+    """
+    leagues = available_leagues()
+    labels = {'scale_seasons': max(len(available_seasons(league)) for league in leagues), 'scale_leagues': len(leagues)}
+    results = []
+    data, result = measure('scaled: parse CSVs', load_leagues, 1, **labels)
+    results.append(result)
+
+    head_to_heads, result = measure('scaled: season pipelines', lambda: {
+        league: [season_pipeline(frames, league_info(league).tiebreaker) for frames in seasons.values()]
+        for league, seasons in data.items()
+    }, repeat, **labels)
+    results.append(result)
+
+    histories = [
+        pd.concat([frames['table'].assign(Season=season) for season, frames in seasons.items()], ignore_index=True)
+        for seasons in data.values()
+    ]
+    directions = {metric: TABLE_RANK_METRICS[metric] for metric in ['Pts', 'GF', 'GA', 'xG', *DERIVED_METRICS]}
+    _, result = measure('scaled: season over season', lambda: [season_over_season(history, list(directions), directions) for history in histories], repeat, **labels)
+    results.append(result)
+    # Summed within each league only; leagues share no clubs
+    _, result = measure('scaled: cumulative head-to-head', lambda: [combine_head_to_head(results) for results in head_to_heads.values()], repeat, **labels)
+    results.append(result)
+    return results
+
+
+def run_scaled(seasons, leagues, repeat):
+    """Generate a synthetic data set and benchmark it in a child process pointed at it.
+
+    The data directory (and with it the team registry) is fixed per process
+    through ``DASHBOARD_DATA_DIR``, so the synthetic leagues are read by a
+    separate run of this module.
+    """
+    with tempfile.TemporaryDirectory() as out_dir:
+        labels = {'scale_seasons': seasons, 'scale_leagues': leagues}
+        _, result = measure('scaled: generate', lambda: synthetic.generate(out_dir, leagues, seasons), 1, **labels)
+        report = Path(out_dir) / 'report.json'
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.pipeline', '--scaled-only', '--repeat', str(repeat), '--output', str(report)],
+            env={**os.environ, 'DASHBOARD_DATA_DIR': out_dir}, cwd=ROOT_DIR, check=True,
+        )
+        return [result] + json.loads(report.read_text(encoding='utf-8'))['results']
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'altair': alt.__version__,
+    }
+
+
+def _result_key(result):
+    return (result['name'], result.get('league'), result.get('season'), result.get('scale_seasons'), result.get('scale_leagues'))
+
+
+def regressions(results, baseline, max_regression):
+    """Return ``(result, baseline median)`` for steps whose median grew by more than ``max_regression``."""
+    previous = {_result_key(result): result['median_ms'] for result in baseline['results']}
+    slower = []
+    for result in results:
+        before = previous.get(_result_key(result))
+        if before is not None and result['median_ms'] > before * (1 + max_regression):
+            slower.append((result, before))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--league', default=DEFAULT_LEAGUE, help="League directory under data/")
+    parser.add_argument('--seasons', nargs='*', type=int, help="Real seasons to benchmark (default: all)")
+    parser.add_argument('--team', default=DEFAULT_TEAM, help="Team for the team-tab steps")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scale-seasons', type=int, default=0, help="Synthetic seasons per league (0 = skip)")
+    parser.add_argument('--scale-leagues', type=int, default=1, help="Synthetic leagues")
+    parser.add_argument('--scaled-only', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help="Write the full JSON report here")
+    parser.add_argument('--baseline', help="Earlier JSON report to compare against")
+    parser.add_argument('--max-regression', type=float, default=0.25, help="Allowed median slowdown, e.g. 0.25 = 25%%")
+    args = parser.parse_args()
+
+    warnings.filterwarnings('ignore')
+    results = []
+    if args.scaled_only:
+        # Child of run_scaled, pointed at the synthetic data set
+        results += bench_scaled(args.repeat)
+    else:
+        for season in args.seasons or available_seasons(args.league):
+            results += bench_season(args.league, season, args.repeat, args.team)[1]
+        if args.scale_seasons:
+            results += run_scaled(args.scale_seasons, args.scale_leagues, args.repeat)
+
+    report = {'environment': environment(), 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline:
+            slower = regressions(results, json.load(baseline), args.max_regression)
+        for result, before in slower:
+            print(f"regression: {result['name']} {before:.2f} ms -> {result['median_ms']:.2f} ms", file=sys.stderr)
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
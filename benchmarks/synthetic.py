@@ -0,0 +1,325 @@
+"""Synthetic league data in the same schemas as the real exports.
+
+Generates any number of leagues, seasons and teams per league, laid out
+like ``data/``:
+
+    <out>/teams.csv                              (all leagues' teams)
+    <out>/leagues.csv
+    <out>/<league>/<season>_table.csv
+    <out>/<league>/<season>_passing.csv          (two-row FBref header)
+    <out>/<league>/<season>_goalkeeping.csv      (two-row FBref header)
+    <out>/<league>/<season>_<league>_matches.csv
+
+Results are drawn per fixture from Poisson goal rates given by each team's
+attack and defence ratings, over a double round-robin schedule. The league
+table is rebuilt from those results with the dashboard's own standings
+(with the league's tie-break rule), and xG/xGA are the summed goal rates,
+so every file agrees with the others. The bottom teams are relegated each
+season and replaced from the league's pool, so promoted sides appear as in
+real data. Team ids are unique across leagues.
+
+Point the dashboard, ``utils.ingest`` or the benchmarks at it with
+``DASHBOARD_DATA_DIR``:
+
+    python -m benchmarks.synthetic /tmp/synthetic --leagues 5 --seasons 50 --teams 20
+    DASHBOARD_DATA_DIR=/tmp/synthetic python -m utils.ingest
+    DASHBOARD_DATA_DIR=/tmp/synthetic python -m benchmarks.pipeline --league league1
+"""
+import argparse
+import csv
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.standings import DEFAULT_TIEBREAKER, TIEBREAKERS, build_standings
+from utils.teams import FBREF, FOOTBALL_DATA
+
+HOME_RATE = 1.5
+AWAY_RATE = 1.15
+RATING_SPREAD = 0.3
+# Season-to-season drift of a team's ratings
+RATING_DRIFT = 0.08
+# Share of the league relegated (and promoted from the pool) each season
+RELEGATED_SHARE = 0.15
+
+TOWNS = [
+    'Alcora', 'Barrosa', 'Calvera', 'Dorada', 'Estrella', 'Fuentes', 'Granada Alta', 'Huerta',
+    'Isla Verde', 'Jarama', 'Lagos', 'Montaña', 'Nervión', 'Olivar', 'Puerto Real', 'Quintana',
+    'Ribera', 'San Lorenzo', 'Torrealta', 'Umbría', 'Valdeluz', 'Xàtiva Nova', 'Yebra', 'Zarzal',
+]
+FIRST_NAMES = ['Álex', 'Bruno', 'Carlos', 'Dani', 'Iker', 'Javi', 'Luis', 'Marco', 'Nico', 'Pablo', 'Raúl', 'Sergio']
+LAST_NAMES = ['Alonso', 'Blanco', 'Castro', 'Díaz', 'Fernández', 'García', 'Herrera', 'Iglesias', 'Molina', 'Navarro', 'Ortega', 'Ruiz']
+
+PASSING_GROUPS = ['Total', '', '', '', '', 'Short', '', '', 'Medium', '', '', 'Long', '', '', '', '', 'Expected'] + [''] * 9
+PASSING_COLUMNS = [
+    'Squad', '# Pl', '90s', 'Cmp', 'Att', 'Cmp%', 'TotDist', 'PrgDist', 'Cmp', 'Att', 'Cmp%', 'Cmp', 'Att', 'Cmp%',
+    'Cmp', 'Att', 'Cmp%', 'Ast', 'xAG', 'xA', 'A-xAG', 'KP', '1/3', 'PPA', 'CrsPA', 'PrgP',
+]
+GK_GROUPS = ['Playing Time', '', '', '', 'Performance'] + [''] * 9 + ['Penalty Kicks'] + [''] * 6
+GK_COLUMNS = [
+    'Squad', '# Pl', 'MP', 'Starts', 'Min', '90s', 'GA', 'GA90', 'SoTA', 'Saves', 'Save%', 'W', 'D', 'L',
+    'CS', 'CS%', 'PKatt', 'PKA', 'PKsv', 'PKm', 'Save%',
+]
+TABLE_COLUMNS = [
+    'Rk', 'Squad', 'MP', 'W', 'D', 'L', 'GF', 'GA', 'GD', 'Pts', 'Pts/MP', 'xG', 'xGA', 'xGD', 'xGD/90',
+    'Attendance', 'Top Team Scorer', 'Goalkeeper', 'Notes',
+]
+MATCH_COLUMNS = ['id', 'utcDate', 'matchday', 'homeTeam.name', 'awayTeam.name', 'score.fullTime.home', 'score.fullTime.away', 'status']
+
+
+def team_pool(league_index, size, first_id):
+    """Return a frame of ``size`` teams with unique ids and per-source names."""
+    names = []
+    for i in range(size):
+        town = TOWNS[i % len(TOWNS)]
+        names.append(town if i < len(TOWNS) else f'{town} {i // len(TOWNS) + 1}')
+    if league_index:
+        names = [f'{name} ({league_index + 1})' for name in names]
+    return pd.DataFrame({
+        'team_id': np.arange(first_id, first_id + size),
+        FBREF: names,
+        FOOTBALL_DATA: [f'CD {name}' for name in names],
+    })
+
+
+def registry_rows(pool):
+    """Rows for ``teams.csv``: one per team and source spelling."""
+    rows = [
+        pool.assign(name=pool[FBREF], source=source, alias=pool[source])[['team_id', 'name', 'source', 'alias']]
+        for source in [FBREF, FOOTBALL_DATA]
+    ]
+    return pd.concat(rows).sort_values(['team_id', 'source'], kind='stable')
+
+
+def round_robin(n):
+    """Return (matchday, home, away) index arrays of a double round-robin between ``n`` teams."""
+    slots = list(range(n)) + ([-1] if n % 2 else [])
+    size = len(slots)
+    fixtures = []
+    for day in range(size - 1):
+        for i in range(size // 2):
+            home, away = slots[i], slots[size - 1 - i]
+            if home >= 0 and away >= 0:
+                # Alternate venues so nobody plays every first-half match at home
+                fixtures.append((day, home, away) if (day + i) % 2 else (day, away, home))
+        slots = [slots[0], slots[-1]] + slots[1:-1]
+    first_half = np.array(fixtures)
+    second_half = first_half[:, [0, 2, 1]] + [size - 1, 0, 0]
+    schedule = np.concatenate([first_half, second_half])
+    return schedule[:, 0] + 1, schedule[:, 1], schedule[:, 2]
+
+
+def _player(rng):
+    return f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+
+
+def play_season(season, teams, attack, defence, rng, first_match_id):
+    """Draw one season's fixtures and results for ``teams`` (pool rows)."""
+    n = len(teams)
+    matchday, home, away = round_robin(n)
+    home_rate = HOME_RATE * np.exp(attack[home] - defence[away])
+    away_rate = AWAY_RATE * np.exp(attack[away] - defence[home])
+    home_goals = rng.poisson(home_rate)
+    away_goals = rng.poisson(away_rate)
+
+    kickoff = datetime(season, 8, 15, tzinfo=timezone.utc) + pd.to_timedelta((matchday - 1) * 7, unit='D')
+    kickoff = kickoff + pd.to_timedelta(rng.choice([14, 16, 17, 19, 21], size=len(matchday)), unit='h')
+    order = np.lexsort((home, kickoff))
+    matches = pd.DataFrame({
+        'id': first_match_id + np.arange(len(matchday)),
+        'utcDate': kickoff[order].strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'matchday': matchday[order],
+        'homeTeam.name': teams[FOOTBALL_DATA].to_numpy()[home[order]],
+        'awayTeam.name': teams[FOOTBALL_DATA].to_numpy()[away[order]],
+        'score.fullTime.home': home_goals[order],
+        'score.fullTime.away': away_goals[order],
+        'status': 'FINISHED',
+    })
+    fixtures = {'home': home, 'away': away, 'home_goals': home_goals, 'away_goals': away_goals,
+                'home_rate': home_rate, 'away_rate': away_rate, 'matchday': matchday}
+    return matches, fixtures
+
+
+def team_records(teams, fixtures, tiebreaker=DEFAULT_TIEBREAKER):
+    """Per-team totals and final rank, using the dashboard's standings rules."""
+    home, away = fixtures['home'], fixtures['away']
+    gf = np.concatenate([fixtures['home_goals'], fixtures['away_goals']])
+    ga = np.concatenate([fixtures['away_goals'], fixtures['home_goals']])
+    long = pd.DataFrame({
+        'TeamID': teams['team_id'].to_numpy()[np.concatenate([home, away])],
+        'OpponentID': teams['team_id'].to_numpy()[np.concatenate([away, home])],
+        'matchday': np.concatenate([fixtures['matchday'], fixtures['matchday']]),
+        'GF': gf,
+        'GA': ga,
+        'Points': np.select([gf > ga, gf < ga], [3, 0], 1),
+    })
+    standings = build_standings(long, tiebreaker)
+    records = pd.DataFrame({col: values[-1] for col, values in standings.cube.items()}, index=standings.team_ids)
+    index = np.searchsorted(standings.team_ids, teams['team_id'].to_numpy())
+    records = records.iloc[index].set_axis(teams.index)
+
+    n = len(teams)
+    records['xG'] = np.bincount(home, fixtures['home_rate'], n) + np.bincount(away, fixtures['away_rate'], n)
+    records['xGA'] = np.bincount(home, fixtures['away_rate'], n) + np.bincount(away, fixtures['home_rate'], n)
+    clean_sheets = np.bincount(home, fixtures['away_goals'] == 0, n) + np.bincount(away, fixtures['home_goals'] == 0, n)
+    records['CS'] = clean_sheets.astype(int)
+    return records
+
+
+def season_table(teams, records, rng):
+    n = len(teams)
+    xg = records['xG'].round(1)
+    xga = records['xGA'].round(1)
+    relegated = max(1, round(n * RELEGATED_SHARE))
+    notes = np.where(records['Rk'] <= 4, '→ Champions League via league finish', np.where(records['Rk'] > n - relegated, 'Relegated', ''))
+    table = pd.DataFrame({
+        'Rk': records['Rk'],
+        'Squad': teams[FBREF],
+        'MP': records['MP'],
+        'W': records['W'],
+        'D': records['D'],
+        'L': records['L'],
+        'GF': records['GF'],
+        'GA': records['GA'],
+        'GD': records['GD'],
+        'Pts': records['Pts'],
+        'Pts/MP': (records['Pts'] / records['MP']).round(2),
+        'xG': xg,
+        'xGA': xga,
+        'xGD': (xg - xga).round(1),
+        'xGD/90': ((xg - xga) / records['MP']).round(2),
+        'Attendance': [f'{value:,}' for value in rng.integers(6_000, 80_000, n)],
+        'Top Team Scorer': [f'{_player(rng)} - {max(1, int(goals * share))}' for goals, share in zip(records['GF'], rng.uniform(0.15, 0.4, n))],
+        'Goalkeeper': [_player(rng) for _ in range(n)],
+        'Notes': notes,
+    })
+    return table.sort_values('Rk')[TABLE_COLUMNS]
+
+
+def season_passing(teams, records, attack, rng):
+    n = len(teams)
+    mp = records['MP'].to_numpy()
+    quality = attack + rng.normal(0, 0.05, n)
+
+    def per_match(mean, spread=0.08):
+        return np.round(mp * mean * np.exp(quality + rng.normal(0, spread, n))).astype(int)
+
+    att = [per_match(160), per_match(190), per_match(80)]
+    pct = [np.clip(rng.normal(mean, 3, n) + 10 * quality, 20, 99).round(1) for mean in (90, 86, 55)]
+    cmp = [np.round(a * p / 100).astype(int) for a, p in zip(att, pct)]
+    total_att = sum(att) + per_match(25)
+    total_cmp = sum(cmp) + per_match(18)
+    xag = (records['xG'].to_numpy() * rng.uniform(0.6, 0.8, n)).round(1)
+    ast = np.round(records['GF'].to_numpy() * rng.uniform(0.55, 0.8, n)).astype(int)
+    columns = [
+        teams[FBREF].to_numpy(), rng.integers(24, 34, n), mp, total_cmp, total_att, (100 * total_cmp / total_att).round(1),
+        per_match(7000), per_match(2500),
+        cmp[0], att[0], pct[0], cmp[1], att[1], pct[1], cmp[2], att[2], pct[2],
+        ast, xag, (xag * rng.uniform(0.9, 1.1, n)).round(1), (ast - xag).round(1),
+        per_match(9), per_match(28), per_match(7), per_match(2.5), per_match(35),
+    ]
+    return pd.DataFrame(dict(enumerate(columns))).sort_values(0)
+
+
+def season_goalkeeping(teams, records, rng):
+    n = len(teams)
+    mp = records['MP'].to_numpy()
+    ga = records['GA'].to_numpy()
+    saves = np.round(ga * rng.uniform(1.6, 2.6, n)).astype(int)
+    sota = ga + saves
+    pk_att = rng.poisson(5, n)
+    pk_allowed = rng.binomial(pk_att, 0.78)
+    pk_saved = rng.binomial(pk_att - pk_allowed, 0.7)
+    pk_missed = pk_att - pk_allowed - pk_saved
+    faced = pk_att - pk_missed
+    pk_save_pct = np.divide(100 * pk_saved, faced, out=np.zeros(n), where=faced > 0).round(1)
+    minutes = mp * 90 - rng.integers(0, 5, n)
+    columns = [
+        teams[FBREF].to_numpy(), rng.integers(1, 4, n), mp, mp, [f'{value:,}' for value in minutes], mp,
+        ga, (ga / mp).round(2), sota, saves, (100 * saves / np.maximum(sota, 1)).round(1),
+        records['W'].to_numpy(), records['D'].to_numpy(), records['L'].to_numpy(),
+        records['CS'].to_numpy(), (100 * records['CS'].to_numpy() / mp).round(1),
+        pk_att, pk_allowed, pk_saved, pk_missed, pk_save_pct,
+    ]
+    return pd.DataFrame(dict(enumerate(columns))).sort_values(0)
+
+
+def _write_grouped_csv(path, groups, columns, frame):
+    # FBref squad exports have a group-label row above the column names
+    with open(path, 'w', newline='', encoding='utf-8') as output:
+        writer = csv.writer(output)
+        writer.writerow(groups)
+        writer.writerow(columns)
+        writer.writerows(frame.itertuples(index=False))
+
+
+def generate_league(out_dir, league, league_index, seasons, first_season, n_teams, rng, first_id=1, tiebreaker=DEFAULT_TIEBREAKER):
+    """Write ``seasons`` seasons of ``league`` to ``out_dir/<league>``; returns its team pool."""
+    league_dir = Path(out_dir) / league
+    league_dir.mkdir(parents=True, exist_ok=True)
+    relegated = max(1, round(n_teams * RELEGATED_SHARE))
+    pool = team_pool(league_index, n_teams + 2 * relegated, first_id)
+    attack = rng.normal(0, RATING_SPREAD, len(pool))
+    defence = rng.normal(0, RATING_SPREAD, len(pool))
+    # Weaker sides start outside the league and come up as others go down
+    members = np.sort(np.argsort(-(attack + defence))[:n_teams])
+
+    match_id = (league_index + 1) * 10_000_000
+    for season in range(first_season, first_season + seasons):
+        teams = pool.iloc[members].reset_index(drop=True)
+        matches, fixtures = play_season(season, teams, attack[members], defence[members], rng, match_id)
+        match_id += len(matches)
+        records = team_records(teams, fixtures, tiebreaker)
+
+        season_table(teams, records, rng).to_csv(league_dir / f'{season}_table.csv', index=False)
+        _write_grouped_csv(league_dir / f'{season}_passing.csv', PASSING_GROUPS, PASSING_COLUMNS, season_passing(teams, records, attack[members], rng))
+        _write_grouped_csv(league_dir / f'{season}_goalkeeping.csv', GK_GROUPS, GK_COLUMNS, season_goalkeeping(teams, records, rng))
+        matches[MATCH_COLUMNS].to_csv(league_dir / f'{season}_{league}_matches.csv', index=False)
+
+        # Relegate the bottom sides, promote the best-rated teams outside the league
+        down = members[np.argsort(records['Rk'].to_numpy())[-relegated:]]
+        outside = np.setdiff1d(np.arange(len(pool)), members)
+        up = outside[np.argsort(-(attack[outside] + defence[outside]))[:relegated]]
+        members = np.sort(np.concatenate([np.setdiff1d(members, down), up]))
+        attack = attack + rng.normal(0, RATING_DRIFT, len(pool))
+        defence = defence + rng.normal(0, RATING_DRIFT, len(pool))
+    return pool
+
+
+def generate(out_dir, leagues=1, seasons=2, teams=20, first_season=2000, seed=0, tiebreaker=DEFAULT_TIEBREAKER, verbose=False):
+    """Write a complete data directory with ``leagues`` synthetic leagues to ``out_dir``."""
+    out_dir = Path(out_dir)
+    rng = np.random.default_rng(seed)
+    pools = []
+    slugs = [f'league{index + 1}' for index in range(leagues)]
+    for index, league in enumerate(slugs):
+        first_id = pools[-1]['team_id'].max() + 1 if pools else 1
+        pools.append(generate_league(out_dir, league, index, seasons, first_season, teams, rng, first_id, tiebreaker))
+        if verbose:
+            print(f"{league}: {seasons} seasons x {teams} teams -> {out_dir / league}")
+    registry_rows(pd.concat(pools)).to_csv(out_dir / 'teams.csv', index=False)
+    pd.DataFrame({
+        'league': slugs,
+        'name': [f'Synthetic League {index + 1}' for index in range(leagues)],
+        'favorite_team': '',
+        'tiebreaker': tiebreaker,
+    }).to_csv(out_dir / 'leagues.csv', index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('out_dir', type=Path, help="Data directory to write the leagues into")
+    parser.add_argument('--leagues', type=int, default=1)
+    parser.add_argument('--seasons', type=int, default=2)
+    parser.add_argument('--teams', type=int, default=20, help="Teams per league and season")
+    parser.add_argument('--first-season', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tiebreaker', choices=TIEBREAKERS, default=DEFAULT_TIEBREAKER, help="How ties on points are broken")
+    args = parser.parse_args()
+    generate(args.out_dir, args.leagues, args.seasons, args.teams, args.first_season, args.seed, args.tiebreaker, verbose=True)
+
+
+if __name__ == '__main__':
+    main()
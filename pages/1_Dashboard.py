@@ -0,0 +1,21 @@
+import streamlit as st
+
+from utils.dashboard import render_dashboard
+from utils.leagues import select_league_season
+from utils.profiling import profiled_run
+
+# Set page configuration
+st.set_page_config(
+    page_title="League Dashboard",
+    page_icon="⚽",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+selection = select_league_season()
+if selection is None:
+    st.info("No league data found. Add season exports under data/<league>/ to get started.")
+else:
+    league, season = selection
+    with profiled_run('dashboard'):
+        render_dashboard(league, season)
@@ -0,0 +1,20 @@
+import streamlit as st
+
+from utils.comparison import render_season_comparison
+from utils.leagues import select_league
+from utils.profiling import profiled_run
+
+# Set page configuration
+st.set_page_config(
+    page_title="Season Comparison",
+    page_icon="⚽",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+league = select_league()
+if league is None:
+    st.info("No league data found. Add season exports under data/<league>/ to get started.")
+else:
+    with profiled_run('season comparison'):
+        render_season_comparison(league)
@@ -0,0 +1,164 @@
+"""Client-side chart specs for the dashboard.
+
+Charts are Vega-Lite specs built with Altair: the server only sends the few
+rows each chart needs, and the browser draws them, so hovering, zooming and
+resizing never cost a rerun or a server-side render.
+"""
+import json
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from utils.profiling import timed
+
+BAR_HEIGHT = 22
+RESULT_COLORS = {'W': 'green', 'D': 'orange', 'L': 'red'}
+
+
+def show_chart(chart, chart_id):
+    # Timed under a fixed id rather than the title, which can name a team
+    with timed(f'chart: {chart_id}'):
+        st.altair_chart(chart, width='stretch')
+
+
+def _field(name):
+    # Vega-Lite reads dots and brackets in field names as nested access
+    return name.replace('.', '\\.').replace('[', '\\[').replace(']', '\\]')
+
+
+def ranking_bar(frame, metric, title, axis_title, scheme='viridis', label='Squad', label_title='Team'):
+    """Horizontal bars of ``metric`` per ``label``, best first, with hover details."""
+    data = frame[[label, metric]]
+    return alt.Chart(data, title=title, height=BAR_HEIGHT * len(data)).mark_bar().encode(
+        x=alt.X(f'{_field(metric)}:Q', title=axis_title),
+        y=alt.Y(f'{_field(label)}:N', sort='-x', title=label_title),
+        color=alt.Color(f'{_field(metric)}:Q', scale=alt.Scale(scheme=scheme), legend=None),
+        tooltip=[alt.Tooltip(f'{_field(label)}:N', title=label_title), alt.Tooltip(f'{_field(metric)}:Q', title=axis_title)],
+    )
+
+
+def histogram(values, title, axis_title, y_title, color, step=None, maxbins=10):
+    data = pd.DataFrame({'value': values.astype(float)})
+    binning = alt.Bin(step=step) if step else alt.Bin(maxbins=maxbins)
+    return alt.Chart(data, title=title).mark_bar(color=color).encode(
+        x=alt.X('value:Q', bin=binning, title=axis_title),
+        y=alt.Y('count():Q', title=y_title),
+        tooltip=[alt.Tooltip('value:Q', bin=binning, title=axis_title), alt.Tooltip('count():Q', title='Count')],
+    )
+
+
+def labeled_scatter(frame, x, y, color, title, x_title, y_title, scheme='viridis', label='Squad'):
+    """Scatter of teams with their names next to the points; drag to pan, scroll to zoom."""
+    data = frame[[label, x, y, color]]
+    base = alt.Chart(data, title=title, height=420).encode(
+        x=alt.X(f'{_field(x)}:Q', title=x_title, scale=alt.Scale(zero=False)),
+        y=alt.Y(f'{_field(y)}:Q', title=y_title, scale=alt.Scale(zero=False)),
+    )
+    points = base.mark_circle(size=120).encode(
+        color=alt.Color(f'{_field(color)}:Q', scale=alt.Scale(scheme=scheme)),
+        tooltip=[f'{_field(label)}:N', f'{_field(x)}:Q', f'{_field(y)}:Q', f'{_field(color)}:Q'],
+    )
+    labels = base.mark_text(align='right', dx=-8, fontSize=10).encode(text=f'{_field(label)}:N')
+    return (points + labels).interactive()
+
+
+def line(series, title, x_title, y_title):
+    data = series.rename_axis('x').reset_index(name='y')
+    return alt.Chart(data, title=title, height=260).mark_line(point=True).encode(
+        x=alt.X('x:Q', title=x_title),
+        y=alt.Y('y:Q', title=y_title),
+        tooltip=[alt.Tooltip('x:Q', title=x_title), alt.Tooltip('y:Q', title=y_title)],
+    )
+
+
+def heatmap(matrix, title):
+    """Annotated heatmap of a square matrix such as ``DataFrame.corr()``."""
+    data = matrix.rename_axis('row').reset_index().melt('row', var_name='column', value_name='value')
+    order = list(matrix.columns)
+    base = alt.Chart(data, title=title, height=360).encode(
+        x=alt.X('column:N', sort=order, title=None),
+        y=alt.Y('row:N', sort=order, title=None),
+    )
+    cells = base.mark_rect().encode(
+        color=alt.Color('value:Q', scale=alt.Scale(scheme='redblue', domain=[-1, 1], reverse=True)),
+        tooltip=['row:N', 'column:N', alt.Tooltip('value:Q', format='.2f')],
+    )
+    text = base.mark_text(fontSize=11).encode(text=alt.Text('value:Q', format='.2f'))
+    return cells + text
+
+
+def results_timeline(team_matches, title):
+    """One tick per matchday coloured by W/D/L, with the opponent and score on hover."""
+    data = team_matches[['matchday', 'Opponent', 'Venue', 'GF', 'GA', 'Result']].dropna(subset=['Result'])
+    data = data.astype({'GF': int, 'GA': int})
+    return alt.Chart(data, title=title, height=70).mark_tick(thickness=6, size=40).encode(
+        x=alt.X('matchday:Q', title='Matchday', scale=alt.Scale(domainMin=1)),
+        color=alt.Color(
+            'Result:N',
+            scale=alt.Scale(domain=list(RESULT_COLORS), range=list(RESULT_COLORS.values())),
+            legend=alt.Legend(orient='right', title=None),
+        ),
+        tooltip=['matchday:Q', 'Opponent:N', 'Venue:N', 'GF:Q', 'GA:Q', 'Result:N'],
+    )
+
+
+def metric_ranking(frame, metrics, labels, scheme='viridis', label='Squad', label_title='Team'):
+    """Ranking bars where the metric and sort order are picked in the browser.
+
+    All ``metrics`` columns are sent once; switching metric or order only
+    re-filters and re-sorts them client-side, without a rerun.
+    """
+    data = frame[[label] + metrics]
+    metric = alt.param(
+        name='metric', value=metrics[0],
+        bind=alt.binding_select(options=metrics, labels=[labels[m] for m in metrics], name='Metric: '),
+    )
+    order = alt.param(
+        name='order', value='Highest first',
+        bind=alt.binding_radio(options=['Highest first', 'Lowest first'], name='Order: '),
+    )
+    names = json.dumps({m: labels[m] for m in metrics})
+    return alt.Chart(data, height=BAR_HEIGHT * len(data)).transform_fold(
+        metrics, as_=['metric', 'value']
+    ).transform_filter(
+        alt.datum.metric == metric
+    ).transform_calculate(
+        rank_key=alt.expr.if_(order == 'Highest first', -alt.datum.value, alt.datum.value)
+    ).mark_bar().encode(
+        x=alt.X('value:Q', title=None),
+        y=alt.Y(f'{_field(label)}:N', sort=alt.EncodingSortField('rank_key', order='ascending'), title=label_title),
+        color=alt.Color('value:Q', scale=alt.Scale(scheme=scheme), legend=None),
+        tooltip=[alt.Tooltip(f'{_field(label)}:N', title=label_title), alt.Tooltip('value:Q', title='Value')],
+    ).properties(
+        title=alt.Title(alt.expr(f"{names}[metric] + ' by Team'"))
+    ).add_params(metric, order)
+
+
+def form_lines(form, window, title):
+    """Rolling points and goal difference per match, with the match details on hover."""
+    data = form[['matchday', 'Opponent', 'Result', 'Form Points', 'Form GD', 'PPG']]
+    return alt.Chart(data, title=title, height=260).transform_fold(
+        ['Form Points', 'Form GD'], as_=['series', 'value']
+    ).mark_line(point=True).encode(
+        x=alt.X('matchday:Q', title='Matchday'),
+        y=alt.Y('value:Q', title=f'Last {window} matches'),
+        color=alt.Color('series:N', title=None, legend=alt.Legend(orient='top')),
+        tooltip=['matchday:Q', 'Opponent:N', 'Result:N', 'Form Points:Q', 'Form GD:Q', alt.Tooltip('PPG:Q', format='.2f')],
+    )
+
+
+def head_to_head_heatmap(records, title, metric='Points'):
+    """Team (rows) x opponent (columns) grid of ``metric``, with the full record on hover."""
+    data = records[['Team', 'Opponent', 'MP', 'Points', 'GF', 'GA', 'Home Points', 'Away Points']]
+    teams = sorted(data['Team'].unique())
+    base = alt.Chart(data, title=title, height=BAR_HEIGHT * len(teams)).encode(
+        x=alt.X('Opponent:N', sort=teams, title='Opponent', axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y('Team:N', sort=teams, title='Team'),
+    )
+    cells = base.mark_rect().encode(
+        color=alt.Color(f'{metric}:Q', scale=alt.Scale(scheme='greens')),
+        tooltip=['Team:N', 'Opponent:N', 'MP:Q', 'Points:Q', 'GF:Q', 'GA:Q', 'Home Points:Q', 'Away Points:Q'],
+    )
+    text = base.mark_text(fontSize=10).encode(text=f'{metric}:Q')
+    return cells + text
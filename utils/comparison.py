@@ -0,0 +1,91 @@
+"""Cross-season comparison page."""
+import streamlit as st
+
+from utils.charts import head_to_head_heatmap, show_chart
+from utils.dashboard import metric_full_names, rank_arrow
+from utils.headtohead import seasons_head_to_head
+from utils.metrics import DERIVED_METRICS
+from utils.profiling import timed
+from utils.rankings import GK_RANK_METRICS, PASSING_RANK_METRICS, TABLE_RANK_METRICS
+from utils.seasons import history_changes, league_history, previous_seasons
+
+# kind -> metrics offered for comparison, with whether higher is better
+COMPARISON_METRICS = {
+    'table': {metric: TABLE_RANK_METRICS[metric] for metric in ['Pts', 'GF', 'GA', 'GD', 'xG', 'xGA', 'xGD', *DERIVED_METRICS]},
+    'passing': {metric: PASSING_RANK_METRICS[metric] for metric in ['PrgP', 'KP', 'xA', 'Ast', 'Cmp%']},
+    'goalkeeping': {metric: GK_RANK_METRICS[metric] for metric in ['Save%', 'CS', 'GA90']},
+}
+KIND_LABELS = {'table': 'League Table', 'passing': 'Passing', 'goalkeeping': 'Goalkeeping'}
+
+
+def render_season_comparison(league):
+    with timed('league history'):
+        history = league_history(league.slug)
+    seasons = sorted(history['table']['Season'].unique())
+    st.title(f"{league.name} Season Comparison")
+    if len(seasons) < 2:
+        st.info("Add at least two seasons to compare them.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        kinds = list(COMPARISON_METRICS)
+        kind_options = [KIND_LABELS[k] for k in kinds]
+        kind = kinds[kind_options.index(st.selectbox("Statistics:", kind_options))]
+    with col2:
+        metrics = list(COMPARISON_METRICS[kind])
+        metric_options = [metric_full_names.get(m, m) for m in metrics]
+        metric = metrics[metric_options.index(st.selectbox("Metric:", metric_options))]
+    with col3:
+        before = previous_seasons(seasons)
+        compared = seasons[1:][::-1]
+        season_options = [f"{s} vs {before[s]}" for s in compared]
+        season = compared[season_options.index(st.selectbox("Season:", season_options))]
+
+    with timed('season-over-season changes'):
+        frame = history_changes(league.slug, kind, COMPARISON_METRICS[kind])
+    current = frame[frame['Season'] == season].sort_values(f'{metric} Rk')
+    label = metric_full_names.get(metric, metric)
+
+    # --- Year-over-Year Changes ---
+    st.markdown(f"### {label}: {season} vs {before[season]}")
+    changes = current.dropna(subset=[f'{metric} Δ'])
+    if not changes.empty:
+        better = changes[f'{metric} Rk Δ'].astype(float)
+        riser = changes.loc[better.idxmax()]
+        faller = changes.loc[better.idxmin()]
+        st.success(f"**Biggest climber:** {riser['Squad']} ({riser[f'{metric} Δ']:+.2f}, {int(riser[f'{metric} Rk Δ']):+d} places)")
+        st.error(f"**Biggest drop:** {faller['Squad']} ({faller[f'{metric} Δ']:+.2f}, {int(faller[f'{metric} Rk Δ']):+d} places)")
+    st.dataframe(
+        current[['Squad', metric, f'{metric} Δ', f'{metric} Rk', f'{metric} Rk Δ']],
+        hide_index=True,
+        width='stretch',
+    )
+    st.caption("Δ is the change against the team's previous season; Rk Δ is the number of places climbed in the league ranking for this metric. Promoted teams have no previous season to compare with.")
+
+    # --- Team Trends ---
+    st.markdown("### Team Trends Across Seasons")
+    latest = current.set_index('team_id')
+    team_ids = dict(zip(latest['Squad'], latest.index))
+    squads = sorted(team_ids)
+    # The favourite team and this season's leader for the metric
+    leader = current['Squad'].iloc[0]
+    default = [squad for squad in dict.fromkeys([league.favorite_team, leader]) if squad in squads]
+    teams = st.multiselect("Teams:", squads, default=default)
+    if teams:
+        ids = [team_ids[team] for team in teams]
+        # Lines follow the team id, so past seasons under another name still join up
+        trend = frame[frame['team_id'].isin(ids)].pivot(index='Season', columns='team_id', values=metric)
+        trend = trend[ids].set_axis(teams, axis=1)
+        trend.index = trend.index.astype(str)
+        st.line_chart(trend)
+        total_teams = len(latest)
+        for team, team_id in zip(teams, ids):
+            rank = latest.loc[team_id, f'{metric} Rk']
+            st.markdown(f"{team}: <b>{latest.loc[team_id, metric]:.2f}</b> {rank_arrow(rank, total_teams)}", unsafe_allow_html=True)
+
+    # --- All-Time Head-to-Head ---
+    st.markdown("### Head-to-Head Across Seasons")
+    with st.expander("Show Cumulative Head-to-Head Matrix"):
+        show_chart(head_to_head_heatmap(seasons_head_to_head(league.slug, seasons).long(), f'Points Won by Each Team (row) vs Each Opponent (column), {seasons[0]}-{seasons[-1]}'), 'cumulative head-to-head heatmap')
+        st.caption("Points summed over every season in the dashboard. Teams that never met in the league have no cell.")
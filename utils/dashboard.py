@@ -0,0 +1,527 @@
+"""League- and season-agnostic dashboard engine.
+
+The dashboard page calls ``render_dashboard`` with the picked league and
+season; the data comes from the shared season cache, so every
+league-season runs the same code path.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.charts import form_lines, head_to_head_heatmap, heatmap, histogram, labeled_scatter, line, metric_ranking, ranking_bar, results_timeline, show_chart
+from utils.data import CONTENT_DIR, load_season
+from utils.form import FORM_WINDOW, season_form
+from utils.headtohead import season_head_to_head
+from utils.leagues import league_info
+from utils.metrics import DERIVED_METRIC_EXPLANATIONS, DERIVED_METRIC_NAMES, DERIVED_METRICS
+from utils.profiling import profiled_fragment, timed
+from utils.rankings import season_ranks
+from utils.splits import season_splits
+from utils.standings import TIEBREAKER_DESCRIPTIONS, season_standings
+from utils.summary import season_summary
+from utils.teams import team_registry
+from utils.transforms import season_team_matches
+
+# --- Metric Names and Explanations ---
+metric_full_names = {
+    'PrgP': 'Progressive Passes (PrgP)',
+    'KP': 'Key Passes (KP)',
+    'xA': 'Expected Assists (xA)',
+    'Ast': 'Assists (Ast)',
+    'Cmp%': 'Pass Completion % (Cmp%)',
+    'Save%': 'Save Percentage (Save%)',
+    'CS': 'Clean Sheets (CS)',
+    'GA': 'Goals Against (GA)',
+    'GA90': 'Goals Against per 90 (GA90)',
+    **DERIVED_METRIC_NAMES,
+}
+
+metric_explanations = {
+    'PrgP': 'Progressive Passes (PrgP) are completed passes that move the ball significantly forward towards the opponent\'s goal.',
+    'KP': 'Key Passes (KP) are passes that directly lead to a teammate taking a shot.',
+    'xA': 'Expected Assists (xA) estimate the likelihood that a given pass will become a goal assist.',
+    'Ast': 'Assists (Ast) are passes that directly result in a goal.',
+    'Cmp%': 'Pass Completion % (Cmp%) is the percentage of attempted passes that are completed.',
+    'Save%': 'Save Percentage (Save%) is the percentage of shots on target that the goalkeeper saves.',
+    'CS': 'Clean Sheets (CS) are matches in which the team conceded zero goals.',
+    'GA': 'Goals Against (GA) is the total number of goals conceded.',
+    'GA90': 'Goals Against per 90 (GA90) is the average number of goals conceded per 90 minutes.',
+    **DERIVED_METRIC_EXPLANATIONS,
+}
+
+
+def render_thoughts(league, season):
+    thoughts = CONTENT_DIR / 'thoughts' / league.slug / f'{season}.md'
+    st.markdown(f"## 💭 My Thoughts on {league.name} {season}")
+    if thoughts.exists():
+        st.markdown(thoughts.read_text(encoding='utf-8'))
+    else:
+        st.info("No thoughts written for this season yet.")
+
+
+def render_overview(data):
+    summary = season_summary(data)
+    league = league_info(data.league)
+    st.markdown(f"## 🏅 {league.name} {data.season} Overview")
+    st.markdown("### Key Records")
+    key_cards = summary.key_records
+    # Display in 3x3 grid
+    for i in range(0, 9, 3):
+        cols = st.columns(3)
+        for j in range(3):
+            label, team, stat = key_cards[i+j]
+            cols[j].markdown(f"""
+                <div style='background-color:#2c3e50; border-radius:8px; padding:0.7em; text-align:center; transition: transform 0.3s ease;'>
+                    <b style='color:#fff;'>{label}</b><br>
+                    <span style='font-size:1.2em; color:#3498db;'><b>{team}</b></span><br>
+                    <span style='color:#eceff1;'>{stat}</span>
+                </div>
+            """, unsafe_allow_html=True)
+    st.divider()
+    st.markdown("### League Table")
+    st.dataframe(
+        summary.league_table,
+        width='stretch',
+        hide_index=True,
+        height=600
+    )
+    st.caption(f"This table summarizes the final league standings and key stats for each team in {league.name} {data.season}.")
+    st.divider()
+    # More league facts
+    highest_scoring = summary.highest_scoring
+    most_common_score = summary.most_common_scoreline
+    st.info(f"Most common result: {summary.most_common_result}")
+    st.success(f"Total goals: {summary.total_goals} | Avg goals per team per match: {summary.avg_goals:.2f}")
+    st.info(f"Highest scoring match: {highest_scoring['homeTeam.name']} {int(highest_scoring['score.fullTime.home'])} - {int(highest_scoring['score.fullTime.away'])} {highest_scoring['awayTeam.name']} ({int(highest_scoring['total_goals'])} goals)")
+    st.info(f"Most common scoreline: {most_common_score[0]} - {most_common_score[1]}")
+    st.caption(f"All stats and records are for the {data.season} {league.name} season. Explore other tabs for deeper insights!")
+
+
+def render_passing_ranking(data):
+    passing_metrics = ['PrgP', 'KP', 'xA', 'Ast', 'Cmp%']
+    show_chart(metric_ranking(data.passing, passing_metrics, metric_full_names), 'passing ranking')
+    st.caption(f"This bar chart shows which teams led {league_info(data.league).name} in the selected passing metric during the {data.season} season. Pick the metric and order under the chart.")
+    st.caption(' '.join(metric_explanations[m] for m in passing_metrics))
+
+
+def render_passing(data):
+    table = data.table
+    passing = data.passing
+    st.header("Passing Trends")
+    render_passing_ranking(data)
+    with st.expander("Distribution of Pass Completion %"):
+        show_chart(histogram(passing['Cmp%'], 'Distribution of Pass Completion % (Cmp%)', 'Pass Completion % (Cmp%)', 'Teams', 'dodgerblue'), 'pass completion histogram')
+        st.caption("This histogram displays how pass completion rates are distributed across all teams. Pass Completion % (Cmp%) is the percentage of attempted passes that are completed.")
+    with st.expander("Passing Impact Analysis"):
+        df = pd.merge(passing, table.drop(columns='Squad'), on='team_id', suffixes=('_pass', '_table'))
+        show_chart(labeled_scatter(df, 'PrgP', 'GF', 'Pts', 'Progressive Passes (PrgP) vs. Goals Scored (GF)', 'Progressive Passes (PrgP)', 'Goals Scored (GF)'), 'passing scatter: goals')
+        st.caption("This scatter plot explores the relationship between Progressive Passes (PrgP) and Goals Scored (GF), colored by total points. Progressive Passes are completed passes that move the ball significantly forward.")
+        show_chart(labeled_scatter(df, 'PrgP', 'Pts', 'GF', 'Progressive Passes (PrgP) vs. Points (Pts)', 'Progressive Passes (PrgP)', 'Points (Pts)', scheme='magma'), 'passing scatter: points')
+        st.caption("This scatter plot shows how Progressive Passes (PrgP) relate to total Points (Pts), with color indicating Goals Scored (GF).")
+        st.markdown("**Tip:** Hover over points to see team names.")
+    with st.expander("Key Passes, Expected Assists, and Assists by Team"):
+        cols = st.columns(3)
+        for col, (metric, scheme) in zip(cols, [('KP', 'tealblues'), ('xA', 'viridis'), ('Ast', 'magma')]):
+            with col:
+                show_chart(ranking_bar(passing, metric, f'{metric_full_names[metric]} by Team', metric_full_names[metric], scheme=scheme), f'passing bars: {metric}')
+        st.caption("These bar charts compare teams by Key Passes (KP), Expected Assists (xA), and actual Assists (Ast). Key Passes are passes leading to a shot; Expected Assists estimate the likelihood a pass becomes a goal.")
+
+
+def render_goalkeeping(data):
+    st.header("Goalkeeping Trends")
+    gk_metrics = ['Save%', 'CS', 'GA', 'GA90']
+    show_chart(metric_ranking(data.goalkeeping, gk_metrics, metric_full_names, scheme='tealblues'), 'goalkeeping ranking')
+    st.caption(f"This bar chart shows which teams led {league_info(data.league).name} in the selected goalkeeping metric during the {data.season} season. Pick the metric and order under the chart.")
+    st.caption(' '.join(metric_explanations[m] for m in gk_metrics))
+
+
+@st.fragment
+@profiled_fragment('matchday results')
+def render_matchday_results(data, first_matchday, last_matchday):
+    matches = data.matches
+    matchday = st.slider("Select a matchday to view details:", first_matchday, last_matchday, first_matchday)
+    md_matches = matches[matches['matchday'] == matchday][['home_team_id', 'score.fullTime.home', 'away_team_id', 'score.fullTime.away', 'status']].copy()
+    md_matches.columns = ['Home Team', 'Home Goals', 'Away Team', 'Away Goals', 'Status']
+
+    # Registry names are consistent with the league table
+    registry = team_registry()
+    md_matches['Home Team'] = registry.display_names(md_matches['Home Team'])
+    md_matches['Away Team'] = registry.display_names(md_matches['Away Team'])
+    md_matches.index = np.arange(1, len(md_matches) + 1)
+    st.markdown(f"#### Matchday {matchday} Results")
+    st.dataframe(md_matches)
+    st.caption("See all results for the selected matchday. Team names are now consistent with the League Table, and indexing starts from 1.")
+
+    st.markdown(f"#### Standings after Matchday {matchday}")
+    st.dataframe(season_standings(data).at(matchday), hide_index=True)
+    tiebreaker = TIEBREAKER_DESCRIPTIONS[league_info(data.league).tiebreaker]
+    st.caption(f"The league table rebuilt from the match results up to the selected matchday. Ties on points are broken by {tiebreaker}.")
+
+
+def render_league_trends(data):
+    table = data.table
+    passing = data.passing
+    matches = data.matches
+    st.header("Match & League Trends")
+    st.markdown("### League-wide Goal Trends")
+    if 'matchday' in matches.columns:
+        goals_per_matchday = data.match_aggregates.goals_series()
+        show_chart(line(goals_per_matchday, 'Total Goals per Matchday', 'Matchday', 'Goals'), 'goals per matchday')
+        st.caption("This line chart shows the total number of goals scored in each matchday across the league.")
+
+        render_matchday_results(data, int(goals_per_matchday.index.min()), int(goals_per_matchday.index.max()))
+
+    st.markdown("### Distribution of Goals per Match")
+    show_chart(histogram(matches['total_goals'].dropna(), 'Distribution of Total Goals per Match', 'Total Goals in Match', 'Number of Matches', '#ff7f0e', step=1), 'goals histogram')
+    st.caption("This histogram shows how many matches had a given number of total goals.")
+
+    st.markdown("### Most and Least Entertaining Matches")
+    summary = season_summary(data)
+    most_goals = summary.highest_scoring
+    least_goals = summary.lowest_scoring
+    st.info(f"**Most goals in a match:** {most_goals['homeTeam.name']} {int(most_goals['score.fullTime.home'])} - {int(most_goals['score.fullTime.away'])} {most_goals['awayTeam.name']} (Total: {int(most_goals['total_goals'])})")
+    st.info(f"**Fewest goals in a match:** {least_goals['homeTeam.name']} {int(least_goals['score.fullTime.home'])} - {int(least_goals['score.fullTime.away'])} {least_goals['awayTeam.name']} (Total: {int(least_goals['total_goals'])})")
+
+    st.markdown("### League-wide Result Rates")
+    aggregates = data.match_aggregates
+    st.success(f"Draw rate: {aggregates.result_rate('Draw'):.1%} | Home win rate: {aggregates.result_rate('Home Win'):.1%} | Away win rate: {aggregates.result_rate('Away Win'):.1%}")
+
+    st.markdown("### Performance vs Expected")
+    derived_metrics = list(DERIVED_METRICS)
+    show_chart(metric_ranking(table, derived_metrics, metric_full_names, scheme='redyellowgreen'), 'derived metrics ranking')
+    st.caption("How each team's goals and points compare with its expected goals. Pick the metric and order under the chart.")
+
+    st.markdown("### Home vs Away")
+    splits = season_splits(data)
+    home_tab, away_tab, advantage_tab = st.tabs(["Home Table", "Away Table", "Home Advantage"])
+    with home_tab:
+        st.dataframe(splits.venue('Home'), width='stretch')
+    with away_tab:
+        st.dataframe(splits.venue('Away'), width='stretch')
+    with advantage_tab:
+        advantage = splits.home_advantage().reset_index()
+        show_chart(ranking_bar(advantage, advantage.columns[1], 'Home Advantage: Home PPG minus Away PPG', 'Points per game difference', scheme='redblue'), 'home advantage bars')
+    st.caption("League tables built from home matches only and away matches only. Home advantage is how many more points per game a team took at home than away.")
+
+    st.markdown("### Head-to-Head")
+    with st.expander("Show Head-to-Head Matrix"):
+        show_chart(head_to_head_heatmap(season_head_to_head(data).long(), 'Points Won by Each Team (row) vs Each Opponent (column)'), 'head-to-head heatmap')
+        st.caption("Each cell shows the points the row team took from the column team over their two meetings. Hover a cell for goals and the home/away split.")
+
+    st.markdown("### Correlation Matrix: Passing, Goals, Points")
+    with st.expander("Show Correlation Matrix"):
+        df = pd.merge(passing, table.drop(columns='Squad'), on='team_id', suffixes=('_pass', '_table'))
+        corr_cols = ['PrgP', 'KP', 'xA', 'Ast', 'Cmp%', 'GF', 'Pts', 'xG']
+        corr = df[corr_cols].corr()
+        show_chart(heatmap(corr, 'Correlation Matrix: Passing, Goals, Points'), 'correlation heatmap')
+        st.caption("This heatmap visualizes the correlations between key passing, scoring, and points metrics across all teams.")
+
+
+def rank_arrow(rank, total_teams):
+    # Rank 1 is the best team for every ranked metric
+    if rank <= total_teams // 2:
+        arrow = '↑'
+        color = 'green'
+    else:
+        arrow = '↓'
+        color = 'red'
+    return f'<span style="color:{color}; font-weight:bold">{arrow} {int(rank)}th</span>'
+
+
+@st.fragment
+@profiled_fragment('team analysis')
+def render_team_analysis(data):
+    table = data.table
+    passing = data.passing
+    goalkeeping = data.goalkeeping
+    ranks = season_ranks(data)
+
+    league = league_info(data.league)
+    squads = table.sort_values('Rk')['Squad'].tolist()
+    default_team = squads.index(league.favorite_team) if league.favorite_team in squads else 0
+    team = st.selectbox("Select a team to analyse:", squads, index=default_team)
+
+    st.markdown(f"## ⚽ {team} Analysis")
+    if team == league.favorite_team:
+        st.markdown("### My Favorite Team's Performance")
+
+    # --- Prepare the team's match data at the very top of the tab ---
+    team_id = team_registry().team_id(team)
+    team_matches = season_team_matches(data)
+    selected_matches = team_matches[team_matches['TeamID'] == team_id].sort_values('matchday')
+
+    # Get the team's data
+    team_data = table[table['team_id'] == team_id].iloc[0]
+    team_passing = passing[passing['team_id'] == team_id].iloc[0]
+    team_gk = goalkeeping[goalkeeping['team_id'] == team_id].iloc[0]
+    team_ranks = {source: frame.loc[team_id] for source, frame in ranks.items()}
+
+    # Key Performance Metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("League Position", f"{team_data['Rk']}th", f"{team_data['Pts']} points")
+    with col2:
+        st.metric("Goals Scored", team_data['GF'], f"xG: {team_data['xG']:.1f}")
+    with col3:
+        ga = float(team_data['GA'])
+        xga = float(team_data['xGA'])
+        if ga > xga:
+            st.markdown(f"""
+                <div style='text-align: center;'>
+                    <div style='font-size: 0.8rem; font-weight: 200; color: #fff;'>Goals Against</div>
+                    <div style='font-size: 2.2rem; font-weight: 100; color: #fff; line-height: 1.5;'>{ga:.0f}</div>
+                    <div style='font-size: 1.1rem; color: red; font-weight: 300; line-height: 1.2;'>↓ xGA: {xga:.1f}</div>
+                </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+                <div style='text-align: center;'>
+                    <div style='font-size: 0.8rem; font-weight: 200; color: #fff;'>Goals Against</div>
+                    <div style='font-size: 2.2rem; font-weight: 100; color: #fff; line-height: 1.5;'>{ga:.0f}</div>
+                    <div style='font-size: 1.1rem; color: green; font-weight: 300; line-height: 1.2;'>↑ xGA: {xga:.1f}</div>
+                </div>
+            """, unsafe_allow_html=True)
+    
+    st.divider()
+    
+    # --- Performance Analysis Rankings ---
+    st.markdown("### Performance Analysis")
+    total_teams = len(table)
+    cols = st.columns(len(DERIVED_METRICS))
+    for col, metric in zip(cols, DERIVED_METRICS):
+        value = team_data[metric]
+        rank = team_ranks['table'][metric]
+        label = DERIVED_METRIC_NAMES[metric].split(' (')[0]
+        if pd.isna(value):
+            col.markdown(f"{label}: <b>-</b>", unsafe_allow_html=True)
+        else:
+            # Differences are signed; xG per point is a plain ratio
+            value_format = '.2f' if metric == 'xG/Pts' else '+.2f'
+            col.markdown(f"{label}: <b>{float(value):{value_format}}</b> {rank_arrow(rank, total_teams)}", unsafe_allow_html=True)
+    st.caption(' '.join(DERIVED_METRIC_EXPLANATIONS[m] for m in DERIVED_METRICS))
+
+    st.divider()
+
+    # --- Passing Analysis Rankings ---
+    st.markdown("### Passing Analysis")
+    passing_metrics = {
+        'Cmp%': 'Pass Completion %',
+        'PrgP': 'Progressive Passes',
+        'KP': 'Key Passes',
+        'xA': 'Expected Assists',
+        'Ast': 'Assists',
+        '1/3': 'Final Third Passes',
+        'PPA': 'Penalty Area Passes',
+        'CrsPA': 'Crosses into Penalty Area',
+        'PrgDist': 'Progressive Distance'
+    }
+    col1, col2 = st.columns(2)
+    with col1:
+        for metric, label in list(passing_metrics.items())[:4]:
+            value = float(team_passing[metric])
+            rank = team_ranks['passing'][metric]
+            st.markdown(f"{label}: <b>{value:.1f}</b> {rank_arrow(rank, total_teams)}", unsafe_allow_html=True)
+    with col2:
+        for metric, label in list(passing_metrics.items())[4:]:
+            value = float(team_passing[metric])
+            rank = team_ranks['passing'][metric]
+            st.markdown(f"{label}: <b>{value:.1f}</b> {rank_arrow(rank, total_teams)}", unsafe_allow_html=True)
+
+    st.divider()
+
+    # --- Goalkeeping Analysis Rankings ---
+    st.markdown("### Goalkeeping Analysis")
+    gk_metrics = {
+        'CS': 'Clean Sheets',
+        'Save%': 'Save %',
+        'GA90': 'Goals Against/90',
+        'SoTA': 'Shots on Target Against',
+        'Saves': 'Total Saves',
+        'PKsv': 'Penalty Kicks Saved'
+    }
+    col1, col2 = st.columns(2)
+    with col1:
+        for metric, label in list(gk_metrics.items())[:3]:
+            value = float(team_gk[metric])
+            rank = team_ranks['goalkeeping'][metric]
+            st.markdown(f"{label}: <b>{value:.1f}</b> {rank_arrow(rank, total_teams)}", unsafe_allow_html=True)
+    with col2:
+        for metric, label in list(gk_metrics.items())[3:]:
+            value = float(team_gk[metric])
+            rank = team_ranks['goalkeeping'][metric]
+            st.markdown(f"{label}: <b>{value:.1f}</b> {rank_arrow(rank, total_teams)}", unsafe_allow_html=True)
+
+    st.divider()
+
+    # --- Passing Profile Table ---
+    st.markdown(f"#### {team} Passing Profile")
+    team_metrics_passing = ['Cmp%', 'PrgP', 'KP', 'xA', 'Ast']
+    team_profile = pd.DataFrame(team_passing[team_metrics_passing]).T
+    team_profile['GF'] = team_data['GF']
+    team_profile['Pts'] = team_data['Pts']
+    team_profile_display = team_profile.rename(columns={
+        'Cmp%': 'Pass Completion %',
+        'PrgP': 'Progressive Passes',
+        'KP': 'Key Passes',
+        'xA': 'Expected Assists',
+        'Ast': 'Assists',
+        'GF': 'Goals For',
+        'Pts': 'Points'
+    })
+    team_profile_display['Team'] = team
+    team_profile_display = team_profile_display[['Team'] + [col for col in team_profile_display.columns if col != 'Team']]
+    st.table(team_profile_display.reset_index(drop=True))
+
+    # --- Top Teams Passing Comparison Table ---
+    st.markdown("#### Top Teams Passing Comparison")
+    top_ids = table.sort_values('Rk')['team_id'].iloc[:5].tolist()
+    top_ids += [team_id] if team_id not in top_ids else []
+    top_df = passing[passing['team_id'].isin(top_ids)].set_index('team_id')
+    top_df_table = table[table['team_id'].isin(top_ids)].set_index('team_id')
+    top_df_combined = top_df[['Squad', 'Cmp%', 'PrgP', 'KP', 'xA', 'Ast']].copy()
+    top_df_combined['GF'] = top_df_table['GF']
+    top_df_combined['Pts'] = top_df_table['Pts']
+    col_rename = {
+        'Cmp%': 'Pass Completion %',
+        'PrgP': 'Progressive Passes',
+        'KP': 'Key Passes',
+        'xA': 'Expected Assists',
+        'Ast': 'Assists',
+        'GF': 'Goals For',
+        'Pts': 'Points'
+    }
+    top_df_combined_display = top_df_combined.rename(columns=col_rename)
+    top_df_combined_display = top_df_combined_display.rename(columns={'Squad': 'Team'})
+    # Sort by Points in descending order
+    top_df_combined_display = top_df_combined_display.sort_values('Points', ascending=False)
+    st.dataframe(top_df_combined_display.reset_index(drop=True), width='stretch')
+
+    # --- Pass Length Profile Table ---
+    st.markdown(f"#### {team} Pass Length Profile")
+    length_metrics = ['Cmp%', 'Short Cmp%', 'Medium Cmp%', 'Long Cmp%', 'PrgDist', 'TotDist']
+    team_length = team_passing[length_metrics]
+    team_length_display = pd.DataFrame([team_length.values], columns=[
+        'Total Pass Completion %',
+        'Short Pass Completion %',
+        'Medium Pass Completion %',
+        'Long Pass Completion %',
+        'Progressive Distance',
+        'Total Distance'
+    ])
+    team_length_display.index = [team]
+    st.dataframe(team_length_display.reset_index(), width='stretch')
+
+    # --- Top Teams Pass Length Comparison Table ---
+    st.markdown("#### Top Teams Pass Length Comparison")
+    top_df_length = top_df[['Squad'] + length_metrics].rename(columns={
+        'Cmp%': 'Total Cmp%',
+        'PrgDist': 'Progressive Distance',
+        'TotDist': 'Total Distance'
+    })
+    length_col_rename = {
+        'Total Cmp%': 'Total Pass Completion %',
+        'Short Cmp%': 'Short Pass Completion %',
+        'Medium Cmp%': 'Medium Pass Completion %',
+        'Long Cmp%': 'Long Pass Completion %',
+        'PrgDist': 'Progressive Distance',
+        'TotDist': 'Total Distance'
+    }
+    top_df_length_display = top_df_length.rename(columns=length_col_rename)
+    top_df_length_display = top_df_length_display.rename(columns={'Squad': 'Team'})
+    # Sort by Total Pass Completion % in descending order
+    top_df_length_display = top_df_length_display.sort_values('Total Pass Completion %', ascending=False)
+    st.dataframe(top_df_length_display.reset_index(drop=True), width='stretch')
+
+    # --- Points Won Against Each Opponent ---
+    st.markdown("#### Points Won Against Each Opponent")
+    st.markdown(f"""
+    <span style='color:#bbb;'>This chart shows the total number of points {team} earned against each {league.name} opponent during the season. 3 points for a win, 1 for a draw, 0 for a loss. It highlights which teams {team} performed best and worst against.</span>
+    """, unsafe_allow_html=True)
+    points_vs_opponent = season_head_to_head(data).team(team_id).reset_index()
+    show_chart(ranking_bar(points_vs_opponent, 'Points', f'Points Won by {team} vs Each Opponent', 'Points', scheme='blues', label='Opponent', label_title='Opponent'), 'opponent points bars')
+
+    # --- Results Sequence ---
+    st.markdown(f"#### {team} Results Sequence")
+    st.markdown(f"""
+    <span style='color:#bbb;'>This visual shows the sequence of {team}'s match results throughout the season. Each bar represents a matchday: green for a win, orange for a draw, and red for a loss. It helps you quickly spot streaks and patterns in performance.</span>
+    """, unsafe_allow_html=True)
+    show_chart(results_timeline(selected_matches, f'{team} Results Sequence (Green=Win, Orange=Draw, Red=Loss)'), 'results timeline')
+
+    # --- Form and Streaks ---
+    st.markdown(f"#### {team} Form and Streaks")
+    st.markdown(f"""
+    <span style='color:#bbb;'>Rolling points and goal difference over the last {FORM_WINDOW} matches, in the order they were played. Hover a point for the opponent, result and points per game so far.</span>
+    """, unsafe_allow_html=True)
+    form = season_form(data)
+    streaks = form.streaks.loc[team_id]
+    for col, (name, length) in zip(st.columns(len(streaks)), streaks.items()):
+        col.metric(name, f"{length} matches")
+    show_chart(form_lines(form.form[form.form['TeamID'] == team_id], FORM_WINDOW, f'{team} Form (last {FORM_WINDOW} matches)'), 'form lines')
+
+    # --- Home vs Away ---
+    st.markdown(f"#### {team} at Home vs Away")
+    st.dataframe(season_splits(data).team(team_id), width='stretch')
+
+    # --- Match-by-Match Results Table ---
+    st.markdown(f"#### {team} Match-by-Match Results")
+    selected_matches_sorted = selected_matches.sort_values('matchday')
+    selected_matches_sorted_display = selected_matches_sorted.rename(columns={
+        'matchday': 'Matchday',
+        'Opponent': 'Opponent',
+        'GF': 'Goals For',
+        'GA': 'Goals Against',
+        'Result': 'Result',
+        'Points': 'Points'
+    })
+    # Sort by Matchday only, not by Points
+    selected_matches_sorted_display = selected_matches_sorted_display.sort_values('Matchday', ascending=True)
+    st.dataframe(selected_matches_sorted_display[['Matchday', 'Opponent', 'Goals For', 'Goals Against', 'Result', 'Points']].reset_index(drop=True), width='stretch')
+
+    st.markdown("""
+    ---
+    *Dashboard by Jovid Jumaev. Built with Streamlit, pandas, Altair.*
+    """) 
+
+
+def render_dashboard(league, season):
+    with timed('load season'):
+        data = load_season(league.slug, season)
+
+    st.title(f"{league.name} {season} General Dashboard")
+    st.markdown(f"> **Explore league-wide trends, efficiency, and style in {league.name} {season}.**")
+
+    # --- Tabs for Main Categories ---
+    # Only the open tab is executed; switching tabs reruns the page
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "💭 My Thoughts",
+        "🏅 Overview",
+        "📈 Passing Analysis",
+        "🧤 Goalkeeping Analysis",
+        "📊 League Trends",
+        "⚽ Team Analysis"
+    ], key="dashboard_tab", on_change="rerun")
+
+    with tab1:
+        if tab1.open:
+            with timed('tab: My Thoughts'):
+                render_thoughts(league, season)
+    with tab2:
+        if tab2.open:
+            with timed('tab: Overview'):
+                render_overview(data)
+    with tab3:
+        if tab3.open:
+            with timed('tab: Passing Analysis'):
+                render_passing(data)
+    with tab4:
+        if tab4.open:
+            with timed('tab: Goalkeeping Analysis'):
+                render_goalkeeping(data)
+    with tab5:
+        if tab5.open:
+            with timed('tab: League Trends'):
+                render_league_trends(data)
+    with tab6:
+        if tab6.open:
+            with timed('tab: Team Analysis'):
+                render_team_analysis(data)
@@ -0,0 +1,370 @@
+"""Season data loading shared by the dashboard pages.
+
+Data is partitioned by league and season: ``data/<league>/<season>_*.csv``.
+A league-season is loaded only when a page asks for it, once per process,
+and the typed frames are shared by every session. The cache key includes
+each source CSV's mtime, so replacing a CSV on disk is picked up on the
+next rerun.
+"""
+import functools
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.incremental import MatchAggregates, apply_match_updates, diff_matches
+from utils.metrics import add_derived_metrics
+from utils.profiling import timed
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+# Overridable to run against another data set, e.g. generated by benchmarks.synthetic
+DATA_DIR = Path(os.environ.get('DASHBOARD_DATA_DIR', ROOT_DIR / "data"))
+CONTENT_DIR = ROOT_DIR / "content"
+
+STAT_KINDS = ('table', 'passing', 'goalkeeping')
+# kind -> source files its frame is built from; the table also carries
+# metrics derived from the passing stats (see utils.metrics)
+FRAME_SOURCES = {'table': ('table', 'passing')}
+# League-seasons whose frames and derived results are kept in memory
+SEASON_CACHE_ENTRIES = 16
+
+
+@dataclass(frozen=True)
+class SeasonData:
+    league: str
+    season: int
+    # kind -> version token; a token changes whenever that frame's data changes
+    versions: dict
+    table: pd.DataFrame
+    passing: pd.DataFrame
+    goalkeeping: pd.DataFrame
+    matches: pd.DataFrame
+    match_aggregates: MatchAggregates
+
+    def version_of(self, *kinds):
+        return tuple(self.versions[kind] for kind in kinds or self.versions)
+
+    @property
+    def version(self):
+        return self.version_of()
+
+
+def _with_team_ids(stats):
+    from utils.teams import FBREF, team_registry
+
+    return stats.assign(team_id=team_registry().ids(stats['Squad'], FBREF))
+
+
+def _read_table(path):
+    table = pd.read_csv(path, thousands=',')
+    table.columns = table.columns.str.strip()
+    return _with_team_ids(table)
+
+
+# FBref repeats column names across header groups; later occurrences get
+# the group as a prefix, e.g. the second Cmp% becomes "Short Cmp%"
+REPEATED_COLUMN_PREFIXES = {
+    'Cmp': ['Short', 'Medium', 'Long'],
+    'Att': ['Short', 'Medium', 'Long'],
+    'Cmp%': ['Short', 'Medium', 'Long'],
+    'Save%': ['PK'],
+}
+
+
+def _squad_stat_columns(path):
+    # The first row only holds group labels ("Total", "Penalty Kicks", ...)
+    names = pd.read_csv(path, header=None, skiprows=1, nrows=1, dtype=str).iloc[0].str.strip()
+    columns = []
+    seen = {}
+    for name in names:
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        columns.append(name if count == 0 else f'{REPEATED_COLUMN_PREFIXES[name][count - 1]} {name}')
+    return columns
+
+
+def _read_squad_stats(path):
+    stats = pd.read_csv(path, header=None, skiprows=2, names=_squad_stat_columns(path), thousands=',')
+    numeric_cols = stats.columns.drop('Squad')
+    stats[numeric_cols] = stats[numeric_cols].apply(pd.to_numeric, errors='coerce')
+    return _with_team_ids(stats)
+
+
+def read_raw_matches(path):
+    """Read a matches export as strings, exactly as stored on disk."""
+    matches = pd.read_csv(path, dtype=str, keep_default_na=False)
+    matches.columns = matches.columns.str.strip()
+    return matches
+
+
+def _read_matches(path):
+    return type_matches(read_raw_matches(path))
+
+
+def type_matches(raw):
+    from utils.teams import FOOTBALL_DATA, team_registry
+
+    registry = team_registry()
+    matches = raw.copy()
+    matches['home_team_id'] = registry.ids(matches['homeTeam.name'], FOOTBALL_DATA)
+    matches['away_team_id'] = registry.ids(matches['awayTeam.name'], FOOTBALL_DATA)
+    matches['id'] = pd.to_numeric(matches['id']).astype('int64')
+    matches['utcDate'] = pd.to_datetime(matches['utcDate'], utc=True)
+    matches['matchday'] = pd.to_numeric(matches['matchday']).astype(int)
+    for col in ['score.fullTime.home', 'score.fullTime.away']:
+        matches[col] = pd.to_numeric(matches[col], errors='coerce')
+    home = matches['score.fullTime.home']
+    away = matches['score.fullTime.away']
+    matches['total_goals'] = home + away
+    result = np.select([home > away, home < away], ['Home Win', 'Away Win'], 'Draw')
+    # Fixtures without a score have not been played and have no result
+    matches['result'] = pd.Series(result, index=matches.index).where(home.notna() & away.notna())
+    return matches
+
+
+# --- Compact Dtypes ---
+INT_DTYPES = ('int16', 'int32', 'int64')
+# Source stats carry at most this many decimals, which float32 reproduces
+FLOAT_DECIMALS = 4
+# Strings become categoricals when at most this share of the values is distinct
+CATEGORY_MAX_RATIO = 0.5
+
+
+def _compact_int(values):
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if values.min() >= info.min and values.max() <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+def _compact_float(values):
+    rounded = values.round(FLOAT_DECIMALS)
+    compact = values.astype('float32')
+    if rounded.equals(values) and compact.astype('float64').round(FLOAT_DECIMALS).equals(rounded):
+        return compact
+    return values
+
+
+def compact_frame(frame):
+    """Return ``frame`` with repeated strings as categoricals and numbers in the smallest lossless dtype."""
+    columns = {}
+    for col, values in frame.items():
+        dtype = values.dtype
+        if values.empty or isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+            columns[col] = values
+        elif pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype):
+            columns[col] = _compact_int(values)
+        elif pd.api.types.is_float_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype):
+            columns[col] = _compact_float(values)
+        elif pd.api.types.is_string_dtype(dtype) and values.nunique() <= len(values) * CATEGORY_MAX_RATIO:
+            columns[col] = values.astype('category')
+        else:
+            columns[col] = values
+    return pd.DataFrame(columns, index=frame.index)
+
+
+def frame_memory(frames):
+    """Return ``{kind: bytes}`` including the string payloads."""
+    return {kind: int(frame.memory_usage(deep=True).sum()) for kind, frame in frames.items()}
+
+
+_READERS = {
+    'table': _read_table,
+    'passing': _read_squad_stats,
+    'goalkeeping': _read_squad_stats,
+    'matches': _read_matches,
+}
+
+
+# --- Season Registry ---
+def league_dir(league):
+    return DATA_DIR / league
+
+
+def _find_season_files(league, season):
+    directory = league_dir(league)
+    files = {kind: directory / f'{season}_{kind}.csv' for kind in STAT_KINDS}
+    # Match exports are named after their source, e.g. 2024_laliga_matches.csv
+    matches = sorted(directory.glob(f'{season}_*matches.csv'))
+    if not matches or not all(path.exists() for path in files.values()):
+        return None
+    files['matches'] = matches[0]
+    return files
+
+
+def discover_seasons(league):
+    """Return ``{season: {kind: path}}`` for every complete season of ``league``."""
+    seasons = {}
+    for table_path in league_dir(league).glob('*_table.csv'):
+        prefix = table_path.name.split('_', 1)[0]
+        if not prefix.isdigit():
+            continue
+        files = _find_season_files(league, int(prefix))
+        if files is not None:
+            seasons[int(prefix)] = files
+    return dict(sorted(seasons.items()))
+
+
+def available_seasons(league):
+    return list(discover_seasons(league))
+
+
+def available_leagues():
+    """Return every league directory in ``data/`` with at least one complete season.
+
+    Only file names are looked at; no season is loaded.
+    """
+    return sorted(path.name for path in DATA_DIR.iterdir() if path.is_dir() and discover_seasons(path.name))
+
+
+def season_paths(league, season):
+    files = _find_season_files(league, season)
+    if files is None:
+        raise FileNotFoundError(f"No complete data files for {league} {season} in {league_dir(league)}")
+    return files
+
+
+def parse_season(files, compact=True):
+    """Parse a season's CSV exports into typed frames, compacted unless ``compact`` is False."""
+    frames = {}
+    for kind, path in files.items():
+        with timed(f'parse {kind} CSV'):
+            frames[kind] = _READERS[kind](path)
+    with timed('derived metrics'):
+        frames['table'] = add_derived_metrics(frames['table'], frames['passing'])
+    if compact:
+        with timed('compact dtypes'):
+            frames = {kind: compact_frame(frame) for kind, frame in frames.items()}
+    return frames
+
+
+def ingest_season(league, season):
+    """Write ``league``'s ``season`` typed frames to the columnar store."""
+    from utils import store
+
+    files = season_paths(league, season)
+    frames = parse_season(files)
+    aggregates = MatchAggregates.from_matches(frames['matches'])
+    return store.write_store(league, season, frames, store.source_digest(files), aggregates)
+
+
+def ingest_match_updates(league, season, path):
+    """Apply new or changed fixtures from ``path`` to ``league``'s ``season``.
+
+    Only fixtures that are new or whose status/score changed (by ``id``) are
+    applied. The season's matches CSV, the columnar store and the stored match
+    aggregates are updated in place, and the matches version changes so
+    downstream caches that only depend on other frames stay valid.
+    Returns the number of fixtures applied.
+    """
+    from utils import store
+
+    files = season_paths(league, season)
+    sources = store.source_digest(files)
+    stored = store.read_store(league, season, sources)
+    if stored is None:
+        ingest_season(league, season)
+        stored = store.read_store(league, season, sources)
+    frames, manifest = stored
+
+    raw_updates = read_raw_matches(path)
+    upserts, replaced = diff_matches(frames['matches'], type_matches(raw_updates))
+    if upserts.empty:
+        return 0
+
+    # Keep the source CSV in step so a full re-ingest reproduces the store
+    raw = read_raw_matches(files['matches'])
+    raw_upserts = raw_updates[raw_updates['id'].astype('int64').isin(upserts['id'])].drop_duplicates('id', keep='last')
+    raw = pd.concat([raw[~raw['id'].astype('int64').isin(upserts['id'])], raw_upserts[raw.columns]], ignore_index=True)
+    raw = raw.sort_values(['utcDate', 'id'], kind='stable')
+    raw.to_csv(files['matches'], index=False)
+
+    matches = compact_frame(apply_match_updates(frames['matches'], upserts))
+    aggregates = MatchAggregates.from_dict(manifest['match_aggregates']).updated(replaced, upserts)
+    store.update_store_matches(league, season, matches, store.source_digest({'matches': files['matches']})['matches'], aggregates)
+    return len(upserts)
+
+
+@st.cache_resource(show_spinner=False, max_entries=SEASON_CACHE_ENTRIES)
+def _load_season(league, season, stamps, registry):
+    from utils import store
+
+    files = {kind: Path(path) for kind, path, _ in stamps}
+    with timed('read store'):
+        stored = store.read_store(league, season, store.source_digest(files))
+    if stored is not None:
+        frames, manifest = stored
+        versions = manifest['versions']
+        aggregates = MatchAggregates.from_dict(manifest['match_aggregates'])
+    else:
+        frames = parse_season(files)
+        mtimes = {kind: mtime for kind, _, mtime in stamps}
+        versions = {kind: (*(mtimes[source] for source in FRAME_SOURCES.get(kind, (kind,))), registry) for kind in mtimes}
+        aggregates = MatchAggregates.from_matches(frames['matches'])
+    return SeasonData(league=league, season=season, versions=versions, match_aggregates=aggregates, **frames)
+
+
+def load_season(league, season):
+    """Return the typed frames for ``league``'s ``season``, re-reading them only when a source CSV changes.
+
+    Frames come from the columnar store when it is up to date with the CSVs,
+    otherwise the CSVs are parsed directly. The returned frames are shared
+    between sessions and must not be mutated; frames from the store are
+    read-only views of its memory-mapped files (see ``utils.store``).
+    """
+    from utils.teams import team_registry
+
+    return _load_season(league, season, season_stamps(league, season), team_registry().digest)
+
+
+def season_stamps(league, season):
+    """Return ``(kind, path, mtime)`` of each source file; changes whenever one is replaced.
+
+    Only the files are stat'ed, so this is a cheap cache key for results
+    built from many seasons without loading them.
+    """
+    return tuple((kind, str(path), path.stat().st_mtime_ns) for kind, path in season_paths(league, season).items())
+
+
+def season_cached(*kinds):
+    """Cache ``func(data)`` per league-season, recomputing only when ``kinds`` change.
+
+    ``kinds`` names the frames the function reads (all frames when empty), so
+    e.g. a match update does not invalidate results built only from the
+    table. Only the latest version of each league-season is kept, for the
+    ``SEASON_CACHE_ENTRIES`` most recently used league-seasons like the
+    season frames themselves, and the result is shared between sessions, so
+    it must not be mutated.
+    """
+    def decorator(func):
+        results = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(data):
+            key = (data.league, data.season)
+            version = data.version_of(*kinds)
+            with lock:
+                cached = results.get(key)
+                if cached is not None and cached[0] == version:
+                    results.move_to_end(key)
+                    return cached[1]
+            with timed(func.__name__):
+                value = func(data)
+            with lock:
+                results[key] = (version, value)
+                results.move_to_end(key)
+                while len(results) > SEASON_CACHE_ENTRIES:
+                    results.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = results.clear
+        return wrapper
+
+    return decorator
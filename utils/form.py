@@ -0,0 +1,65 @@
+"""Rolling form and streaks for every team.
+
+Both are computed over the team-match frame in grouped, vectorized passes
+(one rolling window per team, one run-length encoding for streaks), so all
+teams of a season cost about as much as one.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+
+from utils.data import season_cached
+from utils.transforms import season_team_matches
+
+FORM_WINDOW = 5
+FORM_COLUMNS = ['Points', 'GF', 'GA', 'GD']
+# streak name -> results that keep it going
+STREAKS = {
+    'Longest Winning Run': ['W'],
+    'Longest Unbeaten Run': ['W', 'D'],
+    'Longest Losing Run': ['L'],
+}
+
+
+@dataclass(frozen=True)
+class SeasonForm:
+    # One row per played team match, in date order per team
+    form: pd.DataFrame
+    # TeamID x streak name, longest run of consecutive matches
+    streaks: pd.DataFrame
+
+
+def rolling_form(long, window=FORM_WINDOW):
+    """Return played team matches with rolling ``Form <col>`` sums over the last ``window`` matches and PPG."""
+    played = long[long['Result'].notna()].sort_values(['TeamID', 'utcDate'], kind='stable')
+    values = played[['Points', 'GF', 'GA']].astype(float).assign(GD=lambda frame: frame['GF'] - frame['GA'])
+    by_team = values.groupby(played['TeamID'].to_numpy())
+    rolled = by_team.rolling(window, min_periods=1).sum().reset_index(level=0, drop=True)
+    form = played[['TeamID', 'Team', 'matchday', 'utcDate', 'Opponent', 'Result']].copy()
+    for col in FORM_COLUMNS:
+        form[f'Form {col}'] = rolled[col]
+    form['PPG'] = by_team['Points'].cumsum() / (by_team.cumcount() + 1)
+    return form.reset_index(drop=True)
+
+
+def longest_streaks(form):
+    """Return the longest run of each streak in ``STREAKS`` per team."""
+    team = form['TeamID']
+    streaks = {}
+    for name, results in STREAKS.items():
+        active = form['Result'].isin(results)
+        # A new run starts whenever the condition or the team changes
+        run = ((active != active.shift()) | (team != team.shift())).cumsum()
+        lengths = active.groupby(run).sum()
+        streaks[name] = lengths.groupby(team.groupby(run).first()).max()
+    return pd.DataFrame(streaks).rename_axis('TeamID').astype(int)
+
+
+def build_form(long, window=FORM_WINDOW):
+    form = rolling_form(long, window)
+    return SeasonForm(form, longest_streaks(form))
+
+
+@season_cached("matches")
+def season_form(data):
+    return build_form(season_team_matches(data))
@@ -0,0 +1,81 @@
+"""Head-to-head records between every pair of teams.
+
+``build_head_to_head`` turns the team-match frame into one row per
+(team, opponent) with points and goals, overall and split by venue, using
+a single pivot. Season results are cached, so a head-to-head across
+seasons only sums the cached season frames.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+import streamlit as st
+
+from utils.data import load_season, season_cached, season_stamps
+from utils.teams import team_registry
+from utils.transforms import season_team_matches
+
+H2H_METRICS = ['MP', 'Points', 'GF', 'GA']
+VENUES = ['Home', 'Away']
+
+
+@dataclass(frozen=True)
+class HeadToHead:
+    # One row per (TeamID, OpponentID) with overall and Home/Away columns
+    records: pd.DataFrame
+
+    def team(self, team_id):
+        """Return ``team_id``'s record against each opponent, indexed by opponent name."""
+        records = self.records.xs(team_id, level='TeamID')
+        return records.set_index(team_registry().display_names(records.index.to_series()).rename('Opponent'))
+
+    def matrix(self, metric='Points'):
+        """Return a team x opponent frame of ``metric`` with display names."""
+        names = team_registry().names
+        matrix = self.records[metric].unstack('OpponentID')
+        matrix.index = matrix.index.map(names).rename('Team')
+        matrix.columns = matrix.columns.map(names).rename('Opponent')
+        return matrix
+
+    def long(self):
+        """Return the records with Team/Opponent display names as columns."""
+        names = team_registry().names
+        records = self.records.reset_index()
+        records.insert(0, 'Team', records['TeamID'].map(names))
+        records.insert(1, 'Opponent', records['OpponentID'].map(names))
+        return records
+
+
+def build_head_to_head(long):
+    played = long[long['Result'].notna()]
+    values = played[['TeamID', 'OpponentID', 'Venue']].assign(
+        MP=1, Points=played['Points'].astype(int), GF=played['GF'].astype(int), GA=played['GA'].astype(int),
+    )
+    split = values.pivot_table(index=['TeamID', 'OpponentID'], columns='Venue', values=H2H_METRICS, aggfunc='sum', fill_value=0)
+    split = split.reindex(columns=pd.MultiIndex.from_product([H2H_METRICS, VENUES]), fill_value=0)
+    records = pd.DataFrame({metric: split[metric].sum(axis=1) for metric in H2H_METRICS})
+    for venue in VENUES:
+        for metric in H2H_METRICS:
+            records[f'{venue} {metric}'] = split[(metric, venue)]
+    return HeadToHead(records)
+
+
+def combine_head_to_head(results):
+    """Sum several seasons' ``HeadToHead`` results into one."""
+    records = pd.concat([result.records for result in results])
+    return HeadToHead(records.groupby(level=['TeamID', 'OpponentID']).sum())
+
+
+@season_cached("matches")
+def season_head_to_head(data):
+    return build_head_to_head(season_team_matches(data))
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _seasons_head_to_head(league, stamps, registry):
+    return combine_head_to_head([season_head_to_head(load_season(league, season)) for season, _ in stamps])
+
+
+def seasons_head_to_head(league, seasons):
+    """Cumulative head-to-head over ``league``'s ``seasons``, rebuilt only when one of their files changes."""
+    stamps = tuple((season, season_stamps(league, season)) for season in seasons)
+    return _seasons_head_to_head(league, stamps, team_registry().digest)
@@ -0,0 +1,97 @@
+"""Incremental match updates.
+
+During the season new results arrive a matchday at a time. Instead of
+reloading the whole season, ``diff_matches`` picks out the fixtures that
+are new or whose status/score changed, and ``MatchAggregates.updated``
+adjusts the league-wide aggregates by only those fixtures.
+"""
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+# A stored fixture is replaced when any of these differ in the incoming rows
+MATCH_UPDATE_COLUMNS = ['status', 'score.fullTime.home', 'score.fullTime.away', 'utcDate', 'matchday']
+RESULT_LABELS = ['Home Win', 'Draw', 'Away Win']
+
+
+def diff_matches(stored, incoming):
+    """Return ``(upserts, replaced)``: incoming rows that are new or changed, and the stored rows they replace."""
+    incoming = incoming.drop_duplicates('id', keep='last')
+    cols = [col for col in MATCH_UPDATE_COLUMNS if col in incoming.columns]
+    merged = incoming[['id'] + cols].merge(stored[['id'] + cols], on='id', how='left', suffixes=('', '_stored'), indicator=True)
+    changed = merged['_merge'] == 'left_only'
+    for col in cols:
+        new, old = merged[col], merged[f'{col}_stored']
+        changed |= ~((new == old) | (new.isna() & old.isna())).fillna(False).astype(bool)
+    upsert_ids = merged.loc[changed, 'id']
+    upserts = incoming[incoming['id'].isin(upsert_ids)]
+    replaced = stored[stored['id'].isin(upsert_ids)]
+    return upserts.reset_index(drop=True), replaced.reset_index(drop=True)
+
+
+def apply_match_updates(stored, upserts):
+    """Return ``stored`` with ``upserts`` replacing rows by id and new fixtures appended."""
+    kept = stored[~stored['id'].isin(upserts['id'])]
+    updated = pd.concat([kept, upserts[stored.columns]], ignore_index=True)
+    return updated.sort_values(['utcDate', 'id'], kind='stable').reset_index(drop=True)
+
+
+def _played(matches):
+    return matches[matches['score.fullTime.home'].notna() & matches['score.fullTime.away'].notna()]
+
+
+@dataclass(frozen=True)
+class MatchAggregates:
+    """League-wide match aggregates that can be adjusted by a delta of fixtures."""
+
+    goals_per_matchday: dict = field(default_factory=dict)
+    matches_per_matchday: dict = field(default_factory=dict)
+    result_counts: dict = field(default_factory=lambda: dict.fromkeys(RESULT_LABELS, 0))
+
+    @classmethod
+    def from_matches(cls, matches):
+        return cls().updated(matches.iloc[0:0], matches)
+
+    def updated(self, removed, added):
+        goals = dict(self.goals_per_matchday)
+        played = dict(self.matches_per_matchday)
+        results = dict(self.result_counts)
+        for frame, sign in ((_played(removed), -1), (_played(added), 1)):
+            if frame.empty:
+                continue
+            totals = frame['score.fullTime.home'] + frame['score.fullTime.away']
+            for matchday, value in totals.groupby(frame['matchday']).sum().items():
+                goals[int(matchday)] = goals.get(int(matchday), 0) + sign * int(value)
+            for matchday, value in frame.groupby('matchday').size().items():
+                played[int(matchday)] = played.get(int(matchday), 0) + sign * int(value)
+            for label, value in frame['result'].value_counts().items():
+                results[label] = results.get(label, 0) + sign * int(value)
+        # Drop matchdays that no longer have a played fixture
+        goals = {md: goals[md] for md in sorted(goals) if played.get(md, 0) > 0}
+        played = {md: played[md] for md in sorted(played) if played[md] > 0}
+        return MatchAggregates(goals, played, results)
+
+    @property
+    def total_matches(self):
+        return sum(self.matches_per_matchday.values())
+
+    def goals_series(self):
+        return pd.Series(self.goals_per_matchday, name='goals', dtype='int64').rename_axis('matchday')
+
+    def result_rate(self, label):
+        return self.result_counts.get(label, 0) / self.total_matches if self.total_matches else 0.0
+
+    def to_dict(self):
+        return {
+            'goals_per_matchday': {str(md): goals for md, goals in self.goals_per_matchday.items()},
+            'matches_per_matchday': {str(md): count for md, count in self.matches_per_matchday.items()},
+            'result_counts': self.result_counts,
+        }
+
+    @classmethod
+    def from_dict(cls, values):
+        return cls(
+            {int(md): goals for md, goals in values['goals_per_matchday'].items()},
+            {int(md): count for md, count in values['matches_per_matchday'].items()},
+            dict(values['result_counts']),
+        )
@@ -0,0 +1,66 @@
+"""Convert the league-season CSV exports into the columnar store.
+
+    python -m utils.ingest              # every league and season found in data/
+    python -m utils.ingest --league laliga 2024
+                                        # selected league and seasons only
+    python -m utils.ingest --league laliga --matches 2024 new_results.csv
+                                        # apply new/changed fixtures only
+    python -m utils.ingest --memory     # also report per-frame memory before/after compaction
+"""
+import argparse
+
+from utils.data import available_leagues, available_seasons, frame_memory, ingest_match_updates, ingest_season, parse_season, season_paths
+from utils.leagues import league_info
+from utils.standings import standings_from_matches, validate_standings
+from utils.store import season_store_dir
+
+
+def check_standings(league, season):
+    """Warn when the standings rebuilt from the matches disagree with the final table."""
+    frames = parse_season(season_paths(league, season))
+    standings = standings_from_matches(frames['matches'], league_info(league).tiebreaker)
+    mismatches = validate_standings(standings, frames['table'])
+    if not mismatches.empty:
+        print(f"{league} {season}: standings rebuilt from matches differ from the table for {', '.join(mismatches.index)}")
+
+
+def report_memory(league, season):
+    """Print each frame's in-memory size as parsed and after dtype compaction."""
+    files = season_paths(league, season)
+    before = frame_memory(parse_season(files, compact=False))
+    after = frame_memory(parse_season(files))
+    for kind in before:
+        print(f"  {kind}: {before[kind] / 1024:.1f} KB -> {after[kind] / 1024:.1f} KB ({before[kind] / after[kind]:.1f}x smaller)")
+    print(f"  total: {sum(before.values()) / 1024:.1f} KB -> {sum(after.values()) / 1024:.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert league-season CSVs into the columnar store.")
+    parser.add_argument('seasons', nargs='*', type=int, help="Seasons to ingest (default: all)")
+    parser.add_argument('--league', help="League directory under data/ (default: all leagues)")
+    parser.add_argument('--matches', nargs=2, metavar=('SEASON', 'FILE'),
+                        help="Apply new or changed fixtures from FILE to SEASON of --league instead of a full ingest")
+    parser.add_argument('--memory', action='store_true', help="Report per-frame memory before and after dtype compaction")
+    args = parser.parse_args()
+    leagues = [args.league] if args.league else available_leagues()
+
+    if args.matches:
+        if len(leagues) != 1:
+            parser.error("--matches needs --league when there is more than one league")
+        league, season, path = leagues[0], int(args.matches[0]), args.matches[1]
+        applied = ingest_match_updates(league, season, path)
+        print(f"{league} {season}: applied {applied} new or changed fixtures -> {season_store_dir(league, season)}")
+        return
+
+    for league in leagues:
+        for season in args.seasons or available_seasons(league):
+            manifest = ingest_season(league, season)
+            tables = ', '.join(f"{kind} ({len(dtypes)} cols)" for kind, dtypes in manifest['dtypes'].items())
+            print(f"{league} {season}: {tables} -> {season_store_dir(league, season)}")
+            check_standings(league, season)
+            if args.memory:
+                report_memory(league, season)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Leagues and the league/season navigation.
+
+Every directory under ``data/`` with complete season exports is a league.
+``data/leagues.csv`` gives a league its display name, a favourite team
+for the team tab and the rule that breaks ties on points (see
+``utils.standings``); leagues without a row are named after their
+directory and use the default rule.
+
+The pickers only list what is on disk; the frames of a league-season are
+loaded when a page renders it, so memory follows what users open rather
+than everything in ``data/``. The selection is kept in the URL
+(``?league=laliga&season=2024``), so views can be linked to.
+"""
+import functools
+from dataclasses import dataclass
+
+import pandas as pd
+import streamlit as st
+
+from utils.data import DATA_DIR, available_leagues, available_seasons
+from utils.standings import DEFAULT_TIEBREAKER
+
+LEAGUES_PATH = DATA_DIR / "leagues.csv"
+DEFAULT_LEAGUE = 'laliga'
+LEAGUE_COLUMNS = ['league', 'name', 'favorite_team', 'tiebreaker']
+
+
+@dataclass(frozen=True)
+class League:
+    slug: str
+    name: str
+    favorite_team: str = None
+    tiebreaker: str = DEFAULT_TIEBREAKER
+
+
+@functools.lru_cache(maxsize=1)
+def _read_leagues(path, mtime_ns):
+    # Optional columns may be left out altogether
+    rows = pd.read_csv(path, dtype=str, keep_default_na=False).reindex(columns=LEAGUE_COLUMNS, fill_value='')
+    return {
+        row.league: League(row.league, row.name, row.favorite_team or None, row.tiebreaker or DEFAULT_TIEBREAKER)
+        for row in rows.itertuples()
+    }
+
+
+def league_info(slug):
+    """Return the ``League`` for a data directory, re-reading ``leagues.csv`` only when it changes."""
+    leagues = _read_leagues(str(LEAGUES_PATH), LEAGUES_PATH.stat().st_mtime_ns) if LEAGUES_PATH.exists() else {}
+    return leagues.get(slug, League(slug, slug))
+
+
+def _pick(label, options, param, format_label=str):
+    # Full labels mapped back by index. The URL seeds the picker when it
+    # first appears; afterwards the picker drives the URL.
+    key = f'pick_{param}'
+    labels = [format_label(option) for option in options]
+    if st.session_state.get(key) not in labels:
+        values = [str(option) for option in options]
+        current = st.query_params.get(param)
+        st.session_state[key] = labels[values.index(current)] if current in values else labels[0]
+    choice = options[labels.index(st.sidebar.selectbox(label, labels, key=key))]
+    st.query_params[param] = str(choice)
+    return choice
+
+
+def select_league(min_seasons=1):
+    """Sidebar league picker over leagues with at least ``min_seasons`` seasons; None when there are none."""
+    leagues = [league for league in available_leagues() if len(available_seasons(league)) >= min_seasons]
+    if not leagues:
+        return None
+    if DEFAULT_LEAGUE in leagues:
+        leagues.remove(DEFAULT_LEAGUE)
+        leagues.insert(0, DEFAULT_LEAGUE)
+    return league_info(_pick("League:", leagues, 'league', lambda slug: league_info(slug).name))
+
+
+def select_league_season():
+    """Sidebar league and season pickers, latest season first; ``(League, season)`` or None."""
+    league = select_league()
+    if league is None:
+        return None
+    seasons = available_seasons(league.slug)[::-1]
+    return league, _pick("Season:", seasons, 'season')
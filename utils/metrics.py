@@ -0,0 +1,68 @@
+"""Derived per-team metrics, stored alongside the base stats.
+
+``add_derived_metrics`` computes every metric below for all teams in one
+vectorized pass over the league table (plus the passing frame for xA) when
+a season is parsed. The columns are stored in the table frame, so ranking,
+charts and the season comparison pick them up like any other table column.
+
+Ratios go through ``safe_divide``, which leaves the value missing instead
+of blowing up when the denominator is (close to) zero.
+"""
+import pandas as pd
+
+# Denominators smaller than this in absolute value give a missing ratio
+MIN_DENOMINATOR = 1e-6
+
+# column -> True when a higher value is better
+DERIVED_METRICS = {
+    'GF-xG': True,
+    'xGA-GA': True,
+    'Pts vs xGD': True,
+    'xG/Pts': False,
+    'GF-xA': True,
+}
+DERIVED_METRIC_NAMES = {
+    'GF-xG': 'Clinicality (GF-xG)',
+    'xGA-GA': 'Defensive Resilience (xGA-GA)',
+    'Pts vs xGD': 'Over/Underperformance (Pts vs xGD)',
+    'xG/Pts': 'xG per Point (xG/Pts)',
+    'GF-xA': 'Goals minus Expected Assists (GF-xA)',
+}
+DERIVED_METRIC_EXPLANATIONS = {
+    'GF-xG': 'Clinicality (GF-xG) is goals scored minus expected goals: positive means the team finished better than its chances suggest.',
+    'xGA-GA': 'Defensive Resilience (xGA-GA) is expected goals against minus goals conceded: positive means the team conceded fewer than expected.',
+    'Pts vs xGD': 'Over/Underperformance (Pts vs xGD) is points won minus the points the league-wide trend predicts for the team\'s expected goal difference.',
+    'xG/Pts': 'xG per Point (xG/Pts) is the expected goals a team needed for each point won; lower is more efficient.',
+    'GF-xA': 'Goals minus Expected Assists (GF-xA) is goals scored beyond the chances created by passes, e.g. from individual efforts and set pieces.',
+}
+
+
+def safe_divide(numerator, denominator, min_denominator=MIN_DENOMINATOR):
+    """Divide element-wise, with a missing value wherever ``|denominator| < min_denominator``."""
+    denominator = denominator.where(denominator.abs() >= min_denominator)
+    return numerator / denominator
+
+
+def _expected_points(xgd, pts):
+    # Least-squares line of points on xGD across the league; a ratio such
+    # as Pts / xGD flips sign for negative xGD and explodes near zero
+    centred = xgd - xgd.mean()
+    spread = (centred ** 2).sum()
+    slope = (centred * (pts - pts.mean())).sum() / spread if spread >= MIN_DENOMINATOR else 0.0
+    return pts.mean() + slope * centred
+
+
+def add_derived_metrics(table, passing):
+    """Return ``table`` with a column per ``DERIVED_METRICS`` entry, matched to ``passing`` by team id."""
+    gf, ga, pts = (table[col].astype(float) for col in ['GF', 'GA', 'Pts'])
+    xg, xga, xgd = (table[col].astype(float) for col in ['xG', 'xGA', 'xGD'])
+    xa = table['team_id'].map(passing.set_index('team_id')['xA']).astype(float)
+    derived = pd.DataFrame({
+        'GF-xG': gf - xg,
+        'xGA-GA': xga - ga,
+        'Pts vs xGD': pts - _expected_points(xgd, pts),
+        'xG/Pts': safe_divide(xg, pts),
+        'GF-xA': gf - xa,
+    }, index=table.index)
+    # Inputs carry one decimal; two are plenty and keep the columns float32-compact
+    return table.assign(**derived.round(2))
@@ -0,0 +1,136 @@
+"""Per-rerun timings for the dashboard pages.
+
+Wrap a page in ``profiled_run``, a fragment's body in ``profiled_fragment``
+and any section worth watching in ``timed``. Every timing also goes into an in-process history shared by all
+sessions, so the panel can show percentiles across reruns.
+
+Profiling output is off by default. Open a page with ``?profile=1``, or set
+``DASHBOARD_PROFILE=1`` for every session, to get a timing panel in the
+sidebar and one JSON log line per rerun on the ``dashboard.timing`` logger.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PROFILE_ENV = 'DASHBOARD_PROFILE'
+PROFILE_PARAM = 'profile'
+# Timings kept per section for the percentiles
+HISTORY_SIZE = 1000
+PERCENTILES = [50, 90, 99]
+
+logger = logging.getLogger('dashboard.timing')
+
+_history = defaultdict(lambda: deque(maxlen=HISTORY_SIZE))
+_history_lock = threading.Lock()
+# Each script run has its own thread, which holds that rerun's sections
+_rerun = threading.local()
+
+
+def _is_on(value):
+    return value.strip().lower() not in ('', '0', 'false', 'off', 'no')
+
+
+def profiling_enabled():
+    if _is_on(os.environ.get(PROFILE_ENV, '')):
+        return True
+    return _is_on(st.query_params.get(PROFILE_PARAM, ''))
+
+
+@contextmanager
+def timed(section):
+    """Time the enclosed block as ``section`` for this rerun and the shared history."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        sections = getattr(_rerun, 'sections', None)
+        if sections is not None:
+            sections.append((section, elapsed))
+        with _history_lock:
+            _history[section].append(elapsed)
+
+
+def timing_history():
+    """Return per-section count, mean and percentiles in milliseconds over the recent reruns of all sessions."""
+    with _history_lock:
+        history = {section: np.array(times) for section, times in _history.items()}
+    rows = {
+        section: [len(times), times.mean() * 1000, *(np.percentile(times, PERCENTILES) * 1000)]
+        for section, times in history.items()
+    }
+    columns = ['Runs', 'Mean ms'] + [f'p{p} ms' for p in PERCENTILES]
+    return pd.DataFrame.from_dict(rows, orient='index', columns=columns).rename_axis('Section').sort_values('Mean ms', ascending=False)
+
+
+def _log_rerun(page, sections, total):
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    logger.info(json.dumps({
+        'page': page,
+        'total_ms': round(total * 1000, 2),
+        'sections': [{'section': section, 'ms': round(elapsed * 1000, 2)} for section, elapsed in sections],
+    }, ensure_ascii=False))
+
+
+def _render_panel(sections, total, container):
+    with container.expander("⏱️ Rerun timings", expanded=True):
+        st.caption(f"This rerun: {total * 1000:.0f} ms")
+        rerun = pd.DataFrame(sections, columns=['Section', 'ms'])
+        rerun['ms'] = (rerun['ms'] * 1000).round(1)
+        st.dataframe(rerun, hide_index=True, width='stretch')
+        st.caption("All sessions, recent reruns:")
+        st.dataframe(timing_history().round(1), width='stretch')
+
+
+@contextmanager
+def profiled_run(page, container=st.sidebar):
+    """Collect the timings of one page rerun; show them in ``container`` and log them when profiling is on."""
+    _rerun.sections = []
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        # st.stop()/reruns end the run early; nothing to report
+        _rerun.sections = None
+        raise
+    total = time.perf_counter() - start
+    sections, _rerun.sections = _rerun.sections, None
+    with _history_lock:
+        _history[f'{page} (total)'].append(total)
+    if profiling_enabled():
+        _log_rerun(page, sections, total)
+        _render_panel(sections, total, container)
+
+
+def profiled_fragment(name):
+    """Profile a fragment's own reruns like a page run; apply it under ``@st.fragment``.
+
+    During a full page run the fragment is just a section of that run. A
+    fragment rerun only executes the fragment, so it collects, logs and shows
+    its own timings, with the panel inside the fragment since a fragment
+    cannot write to the sidebar.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(_rerun, 'sections', None) is not None:
+                with timed(name):
+                    return func(*args, **kwargs)
+            with profiled_run(f'{name} (fragment)', container=st):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,42 @@
+"""League-wide rank tables for the team deep-dive.
+
+Every metric the team tab shows is ranked for all teams once per season
+load. Rank 1 is always the best team, whichever direction is better for
+the metric, so looking up a team's rank is a single ``.loc`` by ``team_id``.
+"""
+from utils.data import season_cached
+from utils.metrics import DERIVED_METRICS
+
+# metric -> True when a higher value is better
+TABLE_RANK_METRICS = {
+    'Pts': True, 'W': True, 'D': True, 'L': False, 'GF': True, 'GA': False, 'GD': True,
+    'xG': True, 'xGA': False, 'xGD': True,
+    **DERIVED_METRICS,
+}
+PASSING_RANK_METRICS = {
+    'Cmp%': True, 'PrgP': True, 'KP': True, 'xA': True, 'Ast': True,
+    '1/3': True, 'PPA': True, 'CrsPA': True, 'PrgDist': True, 'TotDist': True,
+}
+GK_RANK_METRICS = {
+    'CS': True, 'Save%': True, 'GA90': False, 'SoTA': False, 'Saves': True, 'PKsv': True,
+}
+
+
+def rank_frame(stats, directions):
+    """Return a team_id x metric frame of ranks (1 = best, ties share the best rank)."""
+    values = stats.set_index('team_id')[list(directions)].astype(float)
+    higher = [metric for metric, higher_is_better in directions.items() if higher_is_better]
+    lower = [metric for metric in directions if metric not in higher]
+    ranks = values[higher].rank(ascending=False, method='min').join(
+        values[lower].rank(ascending=True, method='min')
+    )
+    return ranks[list(directions)].astype('Int64')
+
+
+@season_cached("table", "passing", "goalkeeping")
+def season_ranks(data):
+    return {
+        'table': rank_frame(data.table, TABLE_RANK_METRICS),
+        'passing': rank_frame(data.passing, PASSING_RANK_METRICS),
+        'goalkeeping': rank_frame(data.goalkeeping, GK_RANK_METRICS),
+    }
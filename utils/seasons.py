@@ -0,0 +1,91 @@
+"""Cross-season frames for comparing teams between seasons.
+
+``league_history`` concatenates every season of one league into one frame
+per kind with a leading ``Season`` column. Only the season frames are
+loaded (from the columnar store when it is up to date), none of the
+per-season charts, so adding back-seasons adds one small read each.
+"""
+import pandas as pd
+import streamlit as st
+
+from utils.data import available_seasons, compact_frame, load_season, season_stamps
+
+HISTORY_KINDS = ('table', 'passing', 'goalkeeping', 'matches')
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _league_history(league, stamps, registry):
+    frames = {kind: [] for kind in HISTORY_KINDS}
+    for season, _ in stamps:
+        data = load_season(league, season)
+        for kind in HISTORY_KINDS:
+            frames[kind].append(getattr(data, kind).assign(Season=season))
+    history = {}
+    for kind, parts in frames.items():
+        # Team names repeat across seasons, so they compact to categoricals here
+        frame = compact_frame(pd.concat(parts, ignore_index=True))
+        history[kind] = frame[['Season'] + list(frame.columns.drop('Season'))]
+    return history
+
+
+def league_history(league):
+    """Return ``{kind: frame}`` with every season of ``league`` stacked and a ``Season`` column.
+
+    Rebuilt only when a season is added or one of its frames changes. The
+    frames are shared between sessions and must not be mutated.
+    """
+    return _league_history(league, *_history_stamps(league))
+
+
+def _history_stamps(league):
+    # File stamps rather than loaded versions: a warm rerun must not load
+    # every season, which would cycle the bounded season cache
+    from utils.teams import team_registry
+
+    return tuple((season, season_stamps(league, season)) for season in available_seasons(league)), team_registry().digest
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _history_changes(league, stamps, registry, kind, directions):
+    directions = dict(directions)
+    return season_over_season(_league_history(league, stamps, registry)[kind], list(directions), directions)
+
+
+def history_changes(league, kind, directions):
+    """Return ``season_over_season`` for every season of ``league``'s ``kind``, computed once per data version."""
+    return _history_changes(league, *_history_stamps(league), kind, tuple(directions.items()))
+
+
+def previous_seasons(seasons):
+    """Map each season to the one before it on disk, so gaps between seasons are skipped."""
+    seasons = sorted(seasons)
+    return dict(zip(seasons[1:], seasons[:-1]))
+
+
+def season_over_season(stats, metrics, directions=None):
+    """Return per-team values, year-over-year deltas and rank changes for ``metrics``.
+
+    ``stats`` is a stacked frame from ``league_history``. For every metric
+    the result has the season value, ``<metric> Δ`` against the team's
+    previous season in ``stats`` (see ``previous_seasons``) and ``<metric> Rk Δ`` (positive = climbed). Teams
+    without a previous season, e.g. promoted sides, get missing deltas.
+    ``directions`` maps a metric to True when higher is better (default).
+    """
+    directions = directions or {}
+    frame = stats[['Season', 'team_id', 'Squad'] + metrics].copy()
+    for metric in metrics:
+        ascending = not directions.get(metric, True)
+        frame[f'{metric} Rk'] = frame.groupby('Season')[metric].rank(ascending=ascending, method='min').astype('Int64')
+
+    value_cols = metrics + [f'{metric} Rk' for metric in metrics]
+    # Joined on team_id, so a club whose name changed still has its previous season
+    following = {before: season for season, before in previous_seasons(frame['Season'].unique()).items()}
+    previous = frame.drop(columns='Squad')
+    previous = previous[previous['Season'].isin(following)]
+    previous = previous.assign(Season=previous['Season'].map(following).astype(frame['Season'].dtype))
+    merged = frame.merge(previous, on=['Season', 'team_id'], how='left', suffixes=('', ' prev'))
+    for metric in metrics:
+        merged[f'{metric} Δ'] = merged[metric] - merged[f'{metric} prev']
+        # Ranks count down, so a lower rank than last season is a climb
+        merged[f'{metric} Rk Δ'] = merged[f'{metric} Rk prev'] - merged[f'{metric} Rk']
+    return merged.drop(columns=[f'{col} prev' for col in value_cols])
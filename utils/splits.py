@@ -0,0 +1,66 @@
+"""Home and away splits for every team.
+
+One grouped aggregation over the team-match frame gives each team's home
+and away record. It is cached per matches version and serves both the
+league-wide view and the team deep-dive. The match exports carry no
+per-match xG, so the splits cover results and goals only.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+
+from utils.data import season_cached
+from utils.teams import team_registry
+from utils.transforms import season_team_matches
+
+VENUES = ['Home', 'Away']
+SPLIT_COLUMNS = ['MP', 'W', 'D', 'L', 'Pts', 'GF', 'GA', 'GD', 'PPG', 'Win %']
+
+
+@dataclass(frozen=True)
+class HomeAwaySplits:
+    # (TeamID, Venue) -> SPLIT_COLUMNS
+    records: pd.DataFrame
+
+    def venue(self, venue):
+        """Return every team's record at ``venue`` ('Home' or 'Away'), best first."""
+        records = self.records.xs(venue, level='Venue')
+        records = records.set_index(team_registry().display_names(records.index.to_series()).rename('Squad'))
+        return records.sort_values(['Pts', 'GD', 'GF'], ascending=False)
+
+    def team(self, team_id):
+        """Return ``team_id``'s home and away rows."""
+        return self.records.xs(team_id, level='TeamID').reindex(VENUES)
+
+    def home_advantage(self):
+        """Return home minus away points per game for every team, largest first."""
+        ppg = self.records['PPG'].unstack('Venue')
+        advantage = (ppg['Home'] - ppg['Away']).rename('Home PPG - Away PPG')
+        advantage.index = team_registry().display_names(advantage.index.to_series()).rename('Squad')
+        return advantage.sort_values(ascending=False)
+
+
+def build_splits(long):
+    played = long[long['Result'].notna()]
+    result = played['Result']
+    values = pd.DataFrame({
+        'TeamID': played['TeamID'],
+        'Venue': played['Venue'],
+        'MP': 1,
+        'W': (result == 'W').astype(int),
+        'D': (result == 'D').astype(int),
+        'L': (result == 'L').astype(int),
+        'Pts': played['Points'].astype(int),
+        'GF': played['GF'].astype(int),
+        'GA': played['GA'].astype(int),
+    })
+    records = values.groupby(['TeamID', 'Venue']).sum()
+    records['GD'] = records['GF'] - records['GA']
+    records['PPG'] = (records['Pts'] / records['MP']).round(2)
+    records['Win %'] = (100 * records['W'] / records['MP']).round(1)
+    return HomeAwaySplits(records[SPLIT_COLUMNS])
+
+
+@season_cached("matches")
+def season_splits(data):
+    return build_splits(season_team_matches(data))
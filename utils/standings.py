@@ -0,0 +1,144 @@
+"""League standings rebuilt from match results.
+
+``build_standings`` accumulates every team's record over the matchdays in
+one pass, giving a matchday x team cube of W/D/L/GF/GA/Pts and rank, so the
+table "as of matchday N" is a slice rather than a recomputation.
+
+Ties on points are broken by the league's rule (``tiebreaker`` in
+``data/leagues.csv``):
+
+- ``head-to-head`` (La Liga): head-to-head points and goal difference among
+  the tied teams, then overall goal difference and goals scored;
+- ``goal-difference`` (e.g. the Premier League): overall goal difference and
+  goals scored, then head-to-head points and goal difference.
+
+Before all head-to-head fixtures are played this is an approximation of the
+official order.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from utils.data import season_cached
+from utils.teams import team_registry
+from utils.transforms import season_team_matches, team_match_frame
+
+STANDINGS_COLUMNS = ['Rk', 'Squad', 'MP', 'W', 'D', 'L', 'GF', 'GA', 'GD', 'Pts']
+TIEBREAKERS = ('head-to-head', 'goal-difference')
+# How each rule orders teams level on points, for captions
+TIEBREAKER_DESCRIPTIONS = {
+    'head-to-head': "head-to-head record among the tied teams, then goal difference and goals scored",
+    'goal-difference': "goal difference, then goals scored, then head-to-head record among the teams still level",
+}
+DEFAULT_TIEBREAKER = 'head-to-head'
+
+
+@dataclass(frozen=True)
+class Standings:
+    matchdays: np.ndarray
+    team_ids: np.ndarray
+    teams: np.ndarray
+    # column -> (matchday, team) array of cumulative values
+    cube: dict
+
+    def at(self, matchday):
+        """Return the league table after ``matchday``, ordered by rank."""
+        row = int(np.searchsorted(self.matchdays, matchday))
+        table = pd.DataFrame({col: self.cube[col][row] for col in STANDINGS_COLUMNS if col != 'Squad'})
+        table.insert(1, 'Squad', self.teams)
+        return table.sort_values('Rk').reset_index(drop=True)
+
+    def final(self):
+        return self.at(self.matchdays[-1])
+
+
+def _rank(pts, gd, gf, h2h_pts, h2h_gd, tiebreaker):
+    """Return the 1-based position of every team at every matchday."""
+    team_order = np.broadcast_to(np.arange(pts.shape[1]), pts.shape)
+    if tiebreaker == 'head-to-head':
+        keys = (-pts, -h2h_pts, -h2h_gd, -gd, -gf)
+    else:
+        keys = (-pts, -gd, -gf, -h2h_pts, -h2h_gd)
+    # np.lexsort sorts by the last key first; negate so higher is better
+    order = np.lexsort((team_order, *keys[::-1]), axis=1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, pts.shape[1] + 1), axis=1)
+    return ranks
+
+
+def build_standings(long, tiebreaker=DEFAULT_TIEBREAKER):
+    """Build the standings cube from a team-match frame (see ``team_match_frame``)."""
+    if tiebreaker not in TIEBREAKERS:
+        raise ValueError(f"Unknown tiebreaker {tiebreaker!r}; expected one of {', '.join(TIEBREAKERS)}")
+    team_ids, team_idx = np.unique(long['TeamID'].to_numpy(), return_inverse=True)
+    opp_idx = np.searchsorted(team_ids, long['OpponentID'].to_numpy())
+    teams = team_registry().display_names(pd.Series(team_ids)).to_numpy()
+    matchdays, md_idx = np.unique(long['matchday'].to_numpy(), return_inverse=True)
+
+    played = long['Points'].notna().to_numpy()
+    team_idx, opp_idx, md_idx = team_idx[played], opp_idx[played], md_idx[played]
+    gf = long['GF'].to_numpy(dtype=float, na_value=0)[played]
+    ga = long['GA'].to_numpy(dtype=float, na_value=0)[played]
+    points = long['Points'].to_numpy(dtype=float, na_value=0)[played]
+
+    shape = (len(matchdays), len(team_ids))
+
+    def cumulative(values):
+        totals = np.zeros(shape)
+        np.add.at(totals, (md_idx, team_idx), values)
+        return totals.cumsum(axis=0).astype(int)
+
+    cube = {
+        'MP': cumulative(np.ones_like(points)),
+        'W': cumulative(points == 3),
+        'D': cumulative(points == 1),
+        'L': cumulative(points == 0),
+        'GF': cumulative(gf),
+        'GA': cumulative(ga),
+        'Pts': cumulative(points),
+    }
+    cube['GD'] = cube['GF'] - cube['GA']
+
+    # Head-to-head points and goal difference between every pair of teams
+    pair_shape = shape + (len(team_ids),)
+    h2h_points = np.zeros(pair_shape)
+    h2h_goals = np.zeros(pair_shape)
+    np.add.at(h2h_points, (md_idx, team_idx, opp_idx), points)
+    np.add.at(h2h_goals, (md_idx, team_idx, opp_idx), gf - ga)
+    h2h_points = h2h_points.cumsum(axis=0)
+    h2h_goals = h2h_goals.cumsum(axis=0)
+    tied = cube['Pts'][:, :, None] == cube['Pts'][:, None, :]
+    if tiebreaker == 'goal-difference':
+        # Head-to-head only separates teams still level after GD and goals scored
+        for col in ('GD', 'GF'):
+            tied &= cube[col][:, :, None] == cube[col][:, None, :]
+    h2h_pts = (h2h_points * tied).sum(axis=2)
+    h2h_gd = (h2h_goals * tied).sum(axis=2)
+
+    cube['Rk'] = _rank(cube['Pts'], cube['GD'], cube['GF'], h2h_pts, h2h_gd, tiebreaker)
+    return Standings(matchdays, team_ids, teams, cube)
+
+
+def validate_standings(standings, table):
+    """Return the teams whose rebuilt final ``Rk``/``Pts`` differ from ``table``."""
+    final = pd.DataFrame(
+        {'Rk': standings.cube['Rk'][-1], 'Pts': standings.cube['Pts'][-1]},
+        index=pd.Index(standings.team_ids, name='team_id'),
+    )
+    expected = table.set_index('team_id')[['Rk', 'Pts']]
+    merged = expected.join(final, rsuffix='_rebuilt', how='outer')
+    mismatch = (merged['Rk'] != merged['Rk_rebuilt']) | (merged['Pts'] != merged['Pts_rebuilt'])
+    merged.index = team_registry().display_names(merged.index.to_series())
+    return merged[mismatch.fillna(True).to_numpy()]
+
+
+def standings_from_matches(matches, tiebreaker=DEFAULT_TIEBREAKER):
+    return build_standings(team_match_frame(matches), tiebreaker)
+
+
+@season_cached("matches")
+def season_standings(data):
+    from utils.leagues import league_info
+
+    return build_standings(season_team_matches(data), league_info(data.league).tiebreaker)
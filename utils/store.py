@@ -0,0 +1,140 @@
+"""Columnar season store.
+
+``python -m utils.ingest`` converts each league-season's CSV exports into
+typed Feather (Arrow IPC) files under ``data/store/<league>/<season>/``.
+The loader reads them memory-mapped, so a fresh process skips CSV parsing
+and type coercion.
+
+The frames are zero-copy views of those mappings: numeric columns without
+missing values and category codes point into the file's pages, and so do
+strings on pandas 3, where they load as Arrow-backed arrays (pandas 2 copies
+them into object arrays). Every session of a process shares one copy through
+the season cache, and every server process maps the same pages of the OS
+page cache, so season data takes its size on disk once rather than once per
+process, apart from the copied columns. The views are read-only; a write
+into a loaded frame raises instead of changing it for everyone. Files are
+replaced atomically, never rewritten in place, so processes still holding
+the previous version keep a consistent mapping until they reload.
+A manifest records a hash of every source CSV and of the team registry;
+if either no longer matches, or the store was written in an older format,
+it is ignored until it is re-ingested.
+
+The manifest also keeps a version per frame, a hash of that frame's sources,
+so it changes exactly when they do, and the league-wide match aggregates so that incremental
+match updates (``python -m utils.ingest --matches``) can adjust them in place.
+"""
+import hashlib
+import json
+import os
+
+import pyarrow.feather as feather
+
+from utils.data import DATA_DIR, FRAME_SOURCES
+from utils.teams import team_registry
+
+STORE_DIR = DATA_DIR / "store"
+MANIFEST_NAME = 'manifest.json'
+# Bumped whenever the stored frames' layout changes, e.g. new derived columns
+STORE_FORMAT = 3
+
+
+def source_digest(paths):
+    """Return ``{kind: {"file": name, "sha1": hash}}`` for the season's source files."""
+    digest = {}
+    for kind, path in paths.items():
+        digest[kind] = {'file': path.name, 'sha1': hashlib.sha1(path.read_bytes()).hexdigest()}
+    return digest
+
+
+def season_store_dir(league, season):
+    return STORE_DIR / league / str(season)
+
+
+def read_manifest(league, season):
+    manifest_path = season_store_dir(league, season) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    return json.loads(manifest_path.read_text(encoding='utf-8'))
+
+
+def _frame_versions(sources, registry):
+    """Return a version per kind derived from the hashes of its sources and the registry.
+
+    Built from content rather than counted, so a rebuilt store never reuses
+    a version that meant different data before.
+    """
+    versions = {}
+    for kind in sources:
+        parts = [sources[source]['sha1'] for source in FRAME_SOURCES.get(kind, (kind,))]
+        versions[kind] = hashlib.sha1('|'.join([*parts, registry, str(STORE_FORMAT)]).encode()).hexdigest()[:16]
+    return versions
+
+
+def _replace(path, write):
+    # Write beside the target, then swap it in: readers see the old file or
+    # the new one, and live memory maps of the old file stay valid
+    tmp = path.with_name(f'{path.name}.tmp')
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_manifest(league, season, manifest):
+    path = season_store_dir(league, season) / MANIFEST_NAME
+    _replace(path, lambda tmp: tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding='utf-8'))
+
+
+def _write_frame(league, season, kind, frame):
+    # Uncompressed and in one record batch so each column maps to a single
+    # contiguous buffer that pandas can use without copying
+    path = season_store_dir(league, season) / f'{kind}.feather'
+    _replace(path, lambda tmp: frame.to_feather(tmp, compression='uncompressed', chunksize=max(len(frame), 1)))
+
+
+def _read_frame(path):
+    # split_blocks keeps one pandas block per column, so columns without
+    # nulls are views of the mapped file rather than consolidated copies
+    return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+
+def write_store(league, season, frames, sources, match_aggregates):
+    store_dir = season_store_dir(league, season)
+    store_dir.mkdir(parents=True, exist_ok=True)
+    for kind, frame in frames.items():
+        _write_frame(league, season, kind, frame)
+    registry = team_registry().digest
+    manifest = {
+        'league': league,
+        'season': season,
+        'format': STORE_FORMAT,
+        'sources': sources,
+        'registry': registry,
+        'versions': _frame_versions(sources, registry),
+        'dtypes': {kind: {col: str(dtype) for col, dtype in frame.dtypes.items()} for kind, frame in frames.items()},
+        'match_aggregates': match_aggregates.to_dict(),
+    }
+    _write_manifest(league, season, manifest)
+    return manifest
+
+
+def update_store_matches(league, season, matches, source, match_aggregates):
+    """Replace only the stored matches frame and update its version."""
+    manifest = read_manifest(league, season)
+    _write_frame(league, season, 'matches', matches)
+    manifest['sources']['matches'] = source
+    manifest['versions']['matches'] = _frame_versions({'matches': source}, manifest['registry'])['matches']
+    manifest['dtypes']['matches'] = {col: str(dtype) for col, dtype in matches.dtypes.items()}
+    manifest['match_aggregates'] = match_aggregates.to_dict()
+    _write_manifest(league, season, manifest)
+    return manifest
+
+
+def read_store(league, season, sources):
+    """Return ``(frames, manifest)`` for ``league``'s ``season``, or None when missing or stale."""
+    manifest = read_manifest(league, season)
+    if manifest is None or manifest.get('format') != STORE_FORMAT:
+        return None
+    if manifest.get('sources') != sources or manifest.get('registry') != team_registry().digest:
+        return None
+    store_dir = season_store_dir(league, season)
+    frames = {kind: _read_frame(store_dir / f'{kind}.feather') for kind in sources}
+    return frames, manifest
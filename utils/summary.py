@@ -0,0 +1,90 @@
+"""Season summary behind the Overview tab.
+
+The key-record cards, league facts and extreme matches only change when the
+season data does, so they are computed once per data version and the tab
+just renders them.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+
+from utils.data import season_cached
+
+# label, column, use the max (True) or min (False), unit
+KEY_RECORDS = [
+    ("Most Wins", 'W', True, 'wins'),
+    ("Most Goals For", 'GF', True, 'goals'),
+    ("Fewest Goals Against", 'GA', False, 'goals'),
+    ("Most Draws", 'D', True, 'draws'),
+    ("Best Goal Difference", 'GD', True, 'GD'),
+    ("Most Losses", 'L', True, 'losses'),
+    ("Worst Goal Difference", 'GD', False, 'GD'),
+]
+LEAGUE_TABLE_COLUMNS = ['Rk', 'Squad', 'Pts', 'W', 'D', 'L', 'GF', 'GA', 'GD', 'xG', 'xGA', 'xGD']
+
+
+@dataclass(frozen=True)
+class SeasonSummary:
+    # (label, team, stat) for the nine key-record cards
+    key_records: list
+    league_table: pd.DataFrame
+    result_counts: dict
+    # (home goals, away goals) -> matches, most common first
+    scorelines: pd.Series
+    total_goals: int
+    avg_goals: float
+    highest_scoring: pd.Series
+    lowest_scoring: pd.Series
+
+    @property
+    def most_common_result(self):
+        return max(self.result_counts, key=self.result_counts.get)
+
+    @property
+    def most_common_scoreline(self):
+        return self.scorelines.index[0]
+
+
+def _record(stats, label, column, use_max, unit):
+    values = stats[column].astype(float)
+    row = values.idxmax() if use_max else values.idxmin()
+    return label, stats.loc[row, 'Squad'], f"{int(values[row])} {unit}"
+
+
+def _card_record(table):
+    # The ninth card shows red (or yellow) cards when the table has them
+    if 'CrdR' in table.columns:
+        return _record(table, "Most Red Cards", 'CrdR', True, 'red cards')
+    if 'CrdY' in table.columns:
+        return _record(table, "Most Yellow Cards", 'CrdY', True, 'yellow cards')
+    return _record(table, "Fewest Losses", 'L', False, 'losses')
+
+
+def build_summary(table, goalkeeping, matches, result_counts):
+    key_records = [_record(table, *record) for record in KEY_RECORDS]
+    if 'CS' in goalkeeping.columns:
+        key_records.append(_record(goalkeeping, "Most Clean Sheets", 'CS', True, 'clean sheets'))
+    else:
+        key_records.append(("Most Clean Sheets", '-', '-'))
+    key_records.append(_card_record(table))
+
+    played = matches.dropna(subset=['score.fullTime.home', 'score.fullTime.away'])
+    scorelines = played.groupby(['score.fullTime.home', 'score.fullTime.away'], observed=True).size()
+    scorelines.index = [(int(home), int(away)) for home, away in scorelines.index]
+    total_goals = int(table['GF'].sum())
+    return SeasonSummary(
+        key_records=key_records,
+        league_table=table[LEAGUE_TABLE_COLUMNS].sort_values('Rk'),
+        result_counts=dict(result_counts),
+        scorelines=scorelines.sort_values(ascending=False, kind='stable'),
+        total_goals=total_goals,
+        # Per team per match, whatever the league size or matches played so far
+        avg_goals=total_goals / int(table['MP'].sum()),
+        highest_scoring=played.loc[played['total_goals'].idxmax()],
+        lowest_scoring=played.loc[played['total_goals'].idxmin()],
+    )
+
+
+@season_cached('table', 'goalkeeping', 'matches')
+def season_summary(data):
+    return build_summary(data.table, data.goalkeeping, data.matches, data.match_aggregates.result_counts)
@@ -0,0 +1,59 @@
+"""Canonical team registry shared by every season.
+
+Match exports (football-data) and squad stats (FBref) spell team names
+differently. ``data/teams.csv`` gives every club one integer ``team_id``,
+a display name (the FBref spelling used by the league table) and its
+aliases per source. Ingest resolves names to ids once, so frames join and
+filter on integer keys; an unknown name fails ingest instead of silently
+falling through as an unmatched string.
+"""
+import functools
+import hashlib
+from dataclasses import dataclass
+
+import pandas as pd
+
+from utils.data import DATA_DIR
+
+REGISTRY_PATH = DATA_DIR / "teams.csv"
+FBREF = 'fbref'
+FOOTBALL_DATA = 'football-data'
+
+
+@dataclass(frozen=True)
+class TeamRegistry:
+    # team_id -> display name
+    names: pd.Series
+    # source -> Series of team_id indexed by alias
+    aliases: dict
+    digest: str
+
+    def ids(self, names, source):
+        """Map a Series of ``source`` team names to team ids, failing on unknown names."""
+        ids = names.map(self.aliases[source])
+        unknown = names[ids.isna()].unique()
+        if len(unknown):
+            raise ValueError(f"Unknown {source} team names {sorted(unknown)}; add them to {REGISTRY_PATH.name}")
+        return ids.astype('int32')
+
+    def display_names(self, ids):
+        """Map team ids to display names."""
+        return ids.map(self.names)
+
+    def team_id(self, name):
+        return int(self.aliases[FBREF][name])
+
+
+@functools.lru_cache(maxsize=1)
+def _read_registry(path, mtime_ns):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    rows = pd.read_csv(path, dtype={'team_id': 'int32'})
+    names = rows.drop_duplicates('team_id').set_index('team_id')['name'].sort_index()
+    aliases = {source: group.set_index('alias')['team_id'] for source, group in rows.groupby('source')}
+    return TeamRegistry(names, aliases, hashlib.sha1(raw).hexdigest())
+
+
+def team_registry():
+    """Return the registry, re-reading ``data/teams.csv`` only when it changes."""
+    return _read_registry(str(REGISTRY_PATH), REGISTRY_PATH.stat().st_mtime_ns)
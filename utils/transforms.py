@@ -0,0 +1,50 @@
+"""Vectorized reshaping of match results.
+
+The matches frame has one row per fixture; most team views need one row
+per (team, match) instead. ``team_match_frame`` builds that long format for
+every team at once with NumPy, so a single team's matches are a filter.
+"""
+import numpy as np
+import pandas as pd
+
+from utils.data import season_cached
+from utils.teams import team_registry
+
+_CARRIED_COLUMNS = ['id', 'matchday', 'utcDate', 'status']
+
+
+def team_match_frame(matches):
+    """Return one row per team per match with GF, GA, Result, Points, Opponent and Venue.
+
+    ``Team``/``Opponent`` are registry display names and ``TeamID``/``OpponentID``
+    the registry ids.
+    """
+    n = len(matches)
+    home = matches['home_team_id'].to_numpy()
+    away = matches['away_team_id'].to_numpy()
+    home_goals = matches['score.fullTime.home'].to_numpy(dtype=float)
+    away_goals = matches['score.fullTime.away'].to_numpy(dtype=float)
+
+    gf = np.concatenate([home_goals, away_goals])
+    ga = np.concatenate([away_goals, home_goals])
+    played = ~(np.isnan(gf) | np.isnan(ga))
+
+    carried = matches[[col for col in _CARRIED_COLUMNS if col in matches.columns]]
+    long = pd.concat([carried, carried], ignore_index=True)
+    long['TeamID'] = np.concatenate([home, away])
+    long['OpponentID'] = np.concatenate([away, home])
+    registry = team_registry()
+    long['Team'] = registry.display_names(long['TeamID'])
+    long['Opponent'] = registry.display_names(long['OpponentID'])
+    long['Venue'] = np.repeat(['Home', 'Away'], n)
+    long['GF'] = pd.array(gf, dtype='Int64')
+    long['GA'] = pd.array(ga, dtype='Int64')
+    # Unplayed fixtures keep NaN scores and get no result or points
+    long['Result'] = np.select([gf > ga, gf < ga, played], ['W', 'L', 'D'], default=None)
+    long['Points'] = pd.array(np.select([gf > ga, gf < ga, played], [3, 0, 1], default=np.nan), dtype='Int64')
+    return long.sort_values(['Team', 'matchday'], kind='stable').reset_index(drop=True)
+
+
+@season_cached("matches")
+def season_team_matches(data):
+    return team_match_frame(data.matches)